@@ -1,7 +1,9 @@
-import pygame
+import frame
 
 
 class Button:
+    __slots__ = ("image", "rect", "clicked", "single_click")  # no per-instance __dict__ needed
+
     def __init__(self, x, y, image, single_click):
         self.image = image
         self.rect = self.image.get_rect()
@@ -18,18 +20,19 @@ class Button:
         :return: True if the button was clicked, False otherwise.
         """
         action = False
+        pressed = frame.mouse_left  # sampled once per frame instead of asking SDL for every button
 
-        if self.rect.collidepoint(mouse_pos):  # Check if the mouse cursor is over the buttons rectangle
-            if pygame.mouse.get_pressed()[0] == 1 and not self.clicked:
+        if pressed:
+            # The mouse is only hit tested while the button is pressed, on most frames there is nothing to check
+            if not self.clicked and self.rect.collidepoint(mouse_pos):  # the mouse is over the buttons rectangle
                 action = True
 
                 if self.single_click:
                     # we want to make sure that if statement is not executing again
                     # to prevent repeated triggering with one click
                     self.clicked = True
-
-        # If the mouse button is released we reset the clicked flag back to False
-        if pygame.mouse.get_pressed()[0] == 0:
+        else:
+            # If the mouse button is released we reset the clicked flag back to False
             self.clicked = False
 
         # draw button on screen
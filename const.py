@@ -19,6 +19,13 @@ DAMAGE = 5 # Damage out turret does
 KILL_REWARD = 10 # Amount of money we earn per 1 killed enemy
 WAVE_COMPLETE_REWARD = 50
 
+# Difficulty multipliers applied to enemy stats: (health_multiplier, speed_multiplier)
+DIFFICULTY = {"easy": (0.75, 0.9), "normal": (1.0, 1.0), "hard": (1.25, 1.2)}
+
+# Enemy spatial hash: enemies are bucketed into square cells of 2**ENEMY_HASH_CELL_SHIFT pixels (128 px),
+# so turrets only look at the cells their range overlaps instead of at every enemy
+ENEMY_HASH_CELL_SHIFT = 7
+
 # Map settings
 TILE_SIZE = 48
 ROWS = 20
@@ -27,5 +34,10 @@ COLS = 20
 # Screen settings
 RESOLUTION = (1366, 768)
 FPS = 60
+# Game logic runs in fixed steps of SIM_STEP_MS, independent of how long drawing takes. Clock.tick(FPS) waits
+# a whole number of ms (1000 // FPS), so the step uses the same integer and every frame gets at least one step.
+# After a long stall at most MAX_SIM_STEPS steps are run in one frame, the rest of the lag is dropped.
+SIM_STEP_MS = 1000 // FPS
+MAX_SIM_STEPS = 5
 
 
@@ -1,8 +1,29 @@
 import pygame
-import math
-from pygame.math import Vector2
-from enemy_data import ENEMY_DATA
+from enemy_data import ENEMY_TYPE_ID, ENEMY_HEALTH, ENEMY_SPEED, ENEMY_DAMAGE, ENEMY_KILL_REWARD
 import const as c
+import frame
+
+# enemy consts
+ROTATION_STEP = 5  # Angle in degrees between two cached rotations of an enemy image
+HEALTH_BAR_WIDTH = 40
+HEALTH_BAR_HEIGHT = 5
+HEALTH_BAR_OFFSET_Y = 10  # Distance between the top of the enemy rect and its health bar
+
+
+def angle_bucket(angle):
+    """
+    Quantizes an angle to the nearest multiple of `ROTATION_STEP`.
+
+    Path angles come from atan2 and are often a hair off an axis (179.6, -89.9, ...), so the angle is rounded
+    rather than truncated, which would draw those enemies a whole bucket crooked.
+
+    Args:
+        angle (float): Angle in degrees, as returned by atan2 (-180 to 180).
+
+    Returns:
+        int: The bucket angle in degrees, in the range 0 to 360 - ROTATION_STEP.
+    """
+    return round(angle / ROTATION_STEP) * ROTATION_STEP % 360
 
 
 # Enemy class inherits from pygame.sprite.Sprite thanks to this we inherit all the functionality,
@@ -19,40 +40,45 @@ class Enemy(pygame.sprite.Sprite):
 
         Attributes:
             enemy_type (str): The type of the enemy (e.g., "orc", "goblin").
-            waypoints (list): List of waypoints the enemy will follow.
-            pos (Vector2): Current position of the enemy as a vector.
-            target_waypoint (int): Index of the current target waypoint.
+            type_id (int): Index of the enemy type in the flattened stat tuples from enemy_data.py.
+            path (list): Precomputed (unit_dx, unit_dy, segment_length, angle) tuples of the enemy's path.
+            x (float): Current x-coordinate of the enemy.
+            y (float): Current y-coordinate of the enemy.
+            segment (int): Index of the path segment the enemy is currently walking along.
+            seg_progress (float): Distance the enemy has already covered along the current segment.
             health (float): Current health of the enemy.
             max_health (float): Maximum health of the enemy.
+            health_bar_scale (float): Health bar pixels per point of health (bar width / max health).
             speed (float): Current movement speed of the enemy.
             original_speed (float): Base movement speed of the enemy.
             damage_inflicted (int): Amount of damage the enemy inflicts upon reaching the endpoint.
+            kill_reward (int): Amount of money the player earns for killing the enemy.
             angle (float): Current angle of the enemy's rotation in degrees.
+            finished (bool): Set once the enemy was killed or reached the endpoint and waits to be removed.
             is_slowed (bool): Indicates if the enemy is slowed.
             slow_timer (int): Timestamp for when the slow effect will end.
             image (pygame.Surface): Current image of the enemy, potentially rotated.
             rect (pygame.Rect): Rectangle bounding the enemy for rendering and collision.
             health_multiplier (float): Multiplier applied to the enemy's health based on difficulty.
             speed_multiplier (float): Multiplier applied to the enemy's speed based on difficulty.
+            _rotated_cache (dict): Class-level cache of rotated images keyed by (enemy_type, angle bucket).
+            _last_bucket (int): Angle bucket of the currently displayed image.
 
         Methods:
-            __init__(enemy_type, waypoints, images, difficulty="normal"):
+            __init__(enemy_type, waypoints, path, images, difficulty="normal"):
                 Initializes an enemy with specified attributes and difficulty.
 
-            update(world):
-                Updates the enemy's state, including movement, rotation, health checks, and slow effects.
+            reset(enemy_type, waypoints, path, images, difficulty="normal"):
+                Sets every attribute of the enemy for a new spawn, also used to recycle a removed enemy.
 
-            move(world):
-                Moves the enemy towards its next waypoint or inflicts damage if it reaches the endpoint.
+            move():
+                Moves and turns the enemy along its path and reports whether it has reached the endpoint.
 
             rotate():
-                Rotates the enemy's image to face the next waypoint.
+                Rotates the enemy's image to face the direction of the current path segment, called on segment changes.
 
-            check_if_alive(world):
-                Checks if the enemy is alive and handles its death, including rewards for the player.
-
-            draw_health_bar(surface):
-                Draws a health bar above the enemy to indicate its remaining health.
+            check_if_alive():
+                Checks if the enemy still has health left.
 
             apply_slow(slow_amount, slow_duration):
                 Applies a slowing effect to the enemy, reducing its speed temporarily.
@@ -60,13 +86,25 @@ class Enemy(pygame.sprite.Sprite):
             update_slow_effect():
                 Updates the slow effect based on the timer and resets speed if the effect has ended.
         """
-    def __init__(self, enemy_type, waypoints, images, difficulty="normal"):
+    # Fixed attribute layout: values are stored in slots instead of the instance __dict__, which makes
+    # attribute access in the per-frame update loop cheaper (pygame.sprite.Sprite keeps its own __dict__)
+    __slots__ = (
+        "enemy_type", "type_id", "x", "y", "path", "segment", "seg_progress",
+        "health_multiplier", "speed_multiplier", "health", "max_health", "health_bar_scale",
+        "original_speed", "speed", "damage_inflicted", "kill_reward", "angle",
+        "original_image", "image", "rect", "_last_bucket", "finished", "is_slowed", "slow_timer",
+    )
+
+    _rotated_cache = {}  # shared by all enemies, so each rotation is computed once per enemy type
+
+    def __init__(self, enemy_type, waypoints, path, images, difficulty="normal"):
         """
               Initializes an enemy with specified attributes and difficulty.
 
               Args:
                   enemy_type (str): The type of enemy (e.g., "strong", "elite").
                   waypoints (list): List of (x, y) coordinates representing the enemy's path.
+                  path (list): Path segments precomputed from the waypoints by `precompute_path`.
                   images (dict): Dictionary of enemy type to corresponding Pygame images.
                   difficulty (str, optional): Difficulty level ("easy", "normal", "hard"). Default is "normal".
 
@@ -76,163 +114,128 @@ class Enemy(pygame.sprite.Sprite):
                   - The enemy is initialized without any slow effect.
         """
         pygame.sprite.Sprite.__init__(self)
+        self.reset(enemy_type, waypoints, path, images, difficulty)
+
+    def reset(self, enemy_type, waypoints, path, images, difficulty="normal"):
+        """
+              Sets every attribute of the enemy for a new spawn.
+
+              Args:
+                  enemy_type (str): The type of enemy (e.g., "strong", "elite").
+                  waypoints (list): List of (x, y) coordinates representing the enemy's path.
+                  path (list): Path segments precomputed from the waypoints by `precompute_path`.
+                  images (dict): Dictionary of enemy type to corresponding Pygame images.
+                  difficulty (str, optional): Difficulty level ("easy", "normal", "hard"). Default is "normal".
+
+              Behavior:
+                  - Called by `__init__`, and by `EnemyGroup.spawn` to reuse an enemy that was removed
+                    from the group instead of allocating a new sprite.
+        """
         self.enemy_type = enemy_type
-        # using waypoints list now we can extract pos var (which is starting position of enemy)
-        # and its gonna be 0 index from list
-        self.waypoints = waypoints
-        self.pos = Vector2(
-            self.waypoints[0]   # Starting position of the enemy
-        )  # defining pos as vector gives as more math functionalities so it will make following path much simpler
-        self.target_waypoint = (
-            1  # in 'def move' function we will use this var as argument to self.waypoints[]
-        )
-
-        # Difficulty multipliers
-        if difficulty == "easy":
-            self.health_multiplier = 0.75
-            self.speed_multiplier = 0.9
-        elif difficulty == "hard":
-            self.health_multiplier = 1.25
-            self.speed_multiplier = 1.2
-        else:
-            self.health_multiplier = 1.0
-            self.speed_multiplier = 1.0
+        # starting position of the enemy is the first waypoint, from there it follows precomputed path segments
+        self.x, self.y = waypoints[0]
+        self.path = path
+        self.segment = 0  # in 'def move' function we will use this var as argument to self.path[]
+        self.seg_progress = 0  # distance already walked along the current segment
+
+        # Difficulty multipliers, unknown difficulties play as 'normal'
+        self.health_multiplier, self.speed_multiplier = c.DIFFICULTY.get(difficulty, c.DIFFICULTY["normal"])
 
         # Enemy attributes
-        self.health = ENEMY_DATA[self.enemy_type]["health"] * self.health_multiplier
+        type_id = ENEMY_TYPE_ID[self.enemy_type]
+        self.type_id = type_id
+        self.health = ENEMY_HEALTH[type_id] * self.health_multiplier
         self.max_health = self.health  # MAX health in bar
-        self.original_speed = ENEMY_DATA[self.enemy_type]["speed"] * self.speed_multiplier
+        self.health_bar_scale = HEALTH_BAR_WIDTH / self.max_health  # max_health never changes, so divide once
+        self.original_speed = ENEMY_SPEED[type_id] * self.speed_multiplier
         self.speed = self.original_speed  # Current speed, can be modified by slow effects
-        self.damage_inflicted = ENEMY_DATA[self.enemy_type]["damage_inflicted"]
+        self.damage_inflicted = ENEMY_DAMAGE[type_id]
+        self.kill_reward = ENEMY_KILL_REWARD[type_id]
         self.angle = 0  # Starting angle
 
         # Image and rect setup
         self.original_image = images[self.enemy_type]
-        self.image = pygame.transform.rotate(
-            self.original_image, self.angle
-        )  # rotating original image by given angle
+        self.image = self.original_image  # starting angle is 0, so there is nothing to rotate yet
         self.rect = self.image.get_rect()
-        self.rect.center = self.pos
+        self.rect.center = (self.x, self.y)
+        self._last_bucket = 0  # bucket of the displayed image, the unrotated image is bucket 0
+        self.rotate()  # face the first segment, a cache hit or no-op for every enemy after the first one
+
+        self.finished = False  # `alive` is already a Sprite method, so the removal flag needs another name
 
         # Attributes for slow effect
         self.is_slowed = False
         self.slow_timer = 0
 
-    def update(self, world):
+    def move(self):
         """
-            Updates the enemy's state, including movement, rotation, health checks, and slow effects.
+               Moves the enemy along its current path segment.
 
-            Args:
-                world (World): The current game world, used for health deduction and tracking.
-            """
-        self.move(world)
-        self.rotate()
-        self.check_if_alive(world)
-        self.update_slow_effect()
-
-    def move(self, world):
-        """
-               Moves the enemy towards its next waypoint or inflicts damage if it reaches the endpoint.
-
-               Args:
-                   world (World): The current game world, used for health deduction and tracking missed enemies.
+               Returns:
+                   bool: True if the enemy has reached the end of the path, False otherwise.
 
                Behavior:
-                   - The enemy moves towards the current target waypoint.
-                   - If the enemy reaches the last waypoint, it deducts health from the world and removes itself.
-                   - The movement vector is normalized to ensure consistent speed.
-                   - The target waypoint updates when the enemy reaches the current one.
+                   - The enemy moves along the precomputed unit direction of the current segment.
+                   - Reaching the end of the path is only reported, `EnemyGroup.update` applies the damage.
+                   - Progress along a segment is tracked as a scalar, so no vector has to be normalized per frame.
+                   - The segment index updates when the enemy reaches the end of the current one,
+                     which is the only moment the enemy has to turn, so `rotate` is called from here.
         """
-        # define a target waypoint
-        if self.target_waypoint < len(
-            self.waypoints
-        ):  # as long as we have remaining waypoints in list we keep setting new targets
-            self.target = Vector2(self.waypoints[self.target_waypoint])
-            self.movement = self.target - self.pos  # distance between 2 waypoints
+        if self.segment < len(self.path):  # as long as we have remaining segments we keep following them
+            unit_dx, unit_dy, segment_length, _ = self.path[self.segment]
         else:  # enemy has reached to the end of the path
-            world.health -= self.damage_inflicted
-            world.missed_enemies += 1
-            self.kill()  # kill is method inherited from pygame.sprite.Sprite
-            return
+            return True
 
-        # calculate distance to target
-        dist = self.movement.length()
+        remaining = segment_length - self.seg_progress
 
         # check if remaining distance is greater than enemy speed
-        if dist >= self.speed:  # prevent overshooting the target
-            # normalizing returns a vector with the same direction but length 1
-            # so this function handles the trigonometry, so output [0.948683, 0.316228] means that if we want to enemy
-            # to follow the path we need to move along it by 0.948683 this many pixels, and move it down 0.316228 pixels
-            self.pos += self.movement.normalize() * self.speed
+        if remaining >= self.speed:  # prevent overshooting the target
+            self.x += unit_dx * self.speed
+            self.y += unit_dy * self.speed
+            self.seg_progress += self.speed
         else:
-            if dist != 0:  # 'dist' is zero, it means the enemy has reached perfectly to the target
-                self.pos += (
-                    self.movement.normalize() * dist
-                )  # it will move only a little bit, so it will end perfectly aligned
-                # we are changing the target that enemy is following, otherwise self.movement
-                # would ended as vector 0 which cant be normalize()
-            self.target_waypoint += 1
-
-        # self.rect.center = self.pos
+            # it will move only a little bit, so it will end perfectly aligned with the waypoint
+            self.x += unit_dx * remaining
+            self.y += unit_dy * remaining
+            # we are changing the segment that enemy is following
+            self.segment += 1
+            self.seg_progress = 0
+            self.rotate()
+        self.rect.center = (self.x, self.y)
+        return False
 
     def rotate(self):
         """
         Rotates the enemy to face its current movement direction.
 
-        The rotation is calculated using the angle between the enemy's position and its next waypoint.
-        """
-        #
-        if self.target_waypoint < len(self.waypoints):
-            dist = self.target - self.pos
-            # use distance to calc angle
-            self.angle = math.degrees(
-                math.atan2(-dist[1], dist[0])
-            )  # we invert y-coord because in pygame, the y-coord increases downwards, in contrary to Cartesian system
-            # rotate image and update rectangle
-            self.image = pygame.transform.rotate(
-                self.original_image, self.angle
-            )  # we are operating on 'original_image' to avoid destroying quality of our image due to rotations
-            self.rect = self.image.get_rect()
-            self.rect.center = self.pos
-
-    def check_if_alive(self, world):
+        The angle of the path segment the enemy is walking along is precomputed by `precompute_path`,
+        so this is only needed when the enemy starts a new segment. The angle is rounded to the nearest
+        `ROTATION_STEP` bucket by `angle_bucket` and rotated images are cached per enemy type,
+        so `pygame.transform.rotate` only runs the first time a bucket is needed.
         """
-        Checks if the enemy is alive and handles its death.
-
-        Args:
-            world (World): The current game world, used for tracking killed enemies and awarding rewards.
-
-        Behavior:
-            - If the enemy's health is zero or less, it is removed, and the player is rewarded with money.
+        if self.segment < len(self.path):
+            self.angle = self.path[self.segment][3]
+            bucket = angle_bucket(self.angle)
+            if bucket != self._last_bucket:  # image only changes when the enemy turns into a new bucket
+                self._last_bucket = bucket
+                key = (self.enemy_type, bucket)
+                image = self._rotated_cache.get(key)
+                if image is None:
+                    # we are operating on 'original_image' to avoid destroying quality of our image due to rotations
+                    image = pygame.transform.rotate(self.original_image, bucket)
+                    self._rotated_cache[key] = image
+                self.image = image
+                self.rect = self.image.get_rect()
+                self.rect.center = (self.x, self.y)
+
+    def check_if_alive(self):
         """
-        if self.health <= 0:
-            world.killed_enemies += 1
-            world.money += ENEMY_DATA[self.enemy_type]["kill_reward"]
-            self.kill()
+        Checks if the enemy is alive.
 
-    def draw_health_bar(self, surface):
+        Returns:
+            bool: True if the enemy still has health left, False otherwise.
         """
-        Draw the enemy's health bar above the enemy.
-
-        Args:
-            surface (pygame.Surface): The surface to draw the health bar on.
-        """
-        bar_width = 40
-        bar_height = 5
-        health_ratio = self.health / self.max_health
-        bar_x = self.rect.centerx - bar_width // 2  # Centered horizontally relative to the enemy
-        bar_y = self.rect.top + 10
-
-        # Change color based on slow effect
-        if self.is_slowed:
-            bar_color = (0, 0, 255)  # Blue
-        else:
-            bar_color = (0, 255, 0)  # Green for normal
-
-        # Draw health bar background (red)
-        pygame.draw.rect(surface, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-        # Draw current health
-        pygame.draw.rect(surface, bar_color, (bar_x, bar_y, bar_width * health_ratio, bar_height))
+        return self.health > 0
 
     def apply_slow(self, slow_amount, slow_duration):
         """
@@ -246,12 +249,227 @@ class Enemy(pygame.sprite.Sprite):
         if not self.is_slowed:
             self.is_slowed = True
             self.speed = self.original_speed * (1 - slow_amount)
-            self.slow_timer = pygame.time.get_ticks() + slow_duration
-            print(f"Enemy slowed by {slow_amount * 100}% for {slow_duration}ms.")
+            self.slow_timer = frame.now + slow_duration
 
     def update_slow_effect(self):
         """Update the slow effect based on the timer."""
-        if self.is_slowed and pygame.time.get_ticks() > self.slow_timer:
+        if self.is_slowed and frame.now > self.slow_timer:
             self.is_slowed = False
             self.speed = self.original_speed
-            print("Enemy slow effect has ended.")
+
+
+class EnemyGroup(pygame.sprite.Group):
+    """
+        Sprite group holding every enemy currently on the map.
+
+        Instead of letting each enemy update itself and touch the world on its own, the group walks
+        all enemies in a single pass and applies the accumulated health loss, kills and rewards
+        to the world once per frame.
+
+        Attributes:
+            total_damage (int): Sum of the damage_inflicted of all enemies in the group.
+            pool (list): Enemies removed from the group, kept to be reused by `spawn`.
+
+        Methods:
+            spawn(enemy_type, waypoints, path, images, difficulty="normal"):
+                Adds a new enemy to the group, reusing a pooled enemy when there is one.
+
+            empty():
+                Removes all enemies from the group and keeps them in the pool.
+
+            add_internal(sprite, layer=None):
+                Adds an enemy to the group and its damage to total_damage.
+
+            remove_internal(sprite):
+                Removes an enemy from the group and its damage from total_damage.
+
+            update(world):
+                Moves and checks every enemy, then removes finished enemies and updates the world.
+                Returns True on the frame the wave is completed.
+
+            render_bars(color):
+                Renders a bar of the given color for every possible fill width.
+
+            draw_health_bars(surface):
+                Draws the health bars of all enemies using two batched blits.
+    """
+    def __init__(self, *sprites):
+        """
+            Initializes the group and pre-renders the surfaces used for drawing health bars.
+
+            Args:
+                *sprites (Enemy): Enemies to add to the group right away.
+
+            Behavior:
+                - total_damage starts at 0 and follows every enemy added to or removed from the group.
+                - One red background bar is shared by all enemies.
+                - For every possible fill width (0 to HEALTH_BAR_WIDTH) a green and a blue bar is
+                  rendered once, so drawing a bar only has to pick the right surface by its width.
+        """
+        self.total_damage = 0  # set before the base class adds the given sprites
+        self.pool = []
+        pygame.sprite.Group.__init__(self, *sprites)
+        self.bar_background = pygame.Surface((HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT))
+        self.bar_background.fill((255, 0, 0))  # Red background
+        self.bar_fills = self.render_bars((0, 255, 0))  # Green for normal
+        self.bar_fills_slowed = self.render_bars((0, 0, 255))  # Blue when slowed
+
+    def spawn(self, enemy_type, waypoints, path, images, difficulty="normal"):
+        """
+            Adds a new enemy to the group.
+
+            Args:
+                enemy_type (str): The type of enemy (e.g., "strong", "elite").
+                waypoints (list): List of (x, y) coordinates representing the enemy's path.
+                path (list): Path segments precomputed from the waypoints by `precompute_path`.
+                images (dict): Dictionary of enemy type to corresponding Pygame images.
+                difficulty (str, optional): Difficulty level ("easy", "normal", "hard"). Default is "normal".
+
+            Returns:
+                Enemy: The spawned enemy.
+
+            Behavior:
+                - An enemy from the pool is reset and reused, a new one is only created when the pool is empty.
+        """
+        if self.pool:
+            enemy = self.pool.pop()
+            enemy.reset(enemy_type, waypoints, path, images, difficulty)
+        else:
+            enemy = Enemy(enemy_type, waypoints, path, images, difficulty=difficulty)
+        self.add(enemy)
+        return enemy
+
+    def empty(self):
+        """
+            Removes all enemies from the group.
+
+            Behavior:
+                - The removed enemies are kept in the pool, to be reused by `spawn`.
+        """
+        self.pool.extend(self.sprites())
+        pygame.sprite.Group.empty(self)
+
+    def add_internal(self, sprite, layer=None):
+        """
+            Adds an enemy to the group and its damage to total_damage.
+
+            Args:
+                sprite (Enemy): The enemy being added.
+                layer: Unused, only kept for the signature of pygame.sprite.Group.
+
+            Behavior:
+                - Every way of adding a sprite (add, Sprite.add, the constructor) ends up here.
+        """
+        pygame.sprite.Group.add_internal(self, sprite, layer)
+        self.total_damage += sprite.damage_inflicted
+
+    def remove_internal(self, sprite):
+        """
+            Removes an enemy from the group and its damage from total_damage.
+
+            Args:
+                sprite (Enemy): The enemy being removed.
+
+            Behavior:
+                - Every way of removing a sprite (remove, empty, Sprite.kill) ends up here,
+                  so the skip penalty never has to sum the damage of all enemies again.
+        """
+        pygame.sprite.Group.remove_internal(self, sprite)
+        self.total_damage -= sprite.damage_inflicted
+
+    @staticmethod
+    def render_bars(color):
+        """
+            Renders a solid color bar for every possible health bar fill width.
+
+            Args:
+                color (tuple): RGB color of the bars.
+
+            Returns:
+                list: Surfaces indexed by their width in pixels, from 0 to HEALTH_BAR_WIDTH.
+        """
+        bars = []
+        for width in range(HEALTH_BAR_WIDTH + 1):
+            bar = pygame.Surface((width, HEALTH_BAR_HEIGHT))
+            bar.fill(color)
+            bars.append(bar)
+        return bars
+
+    def update(self, world):
+        """
+            Updates the state of every enemy in the group.
+
+            Args:
+                world (World): The current game world, used for health deduction and tracking.
+
+            Returns:
+                bool: True if this update removed the last enemy of the wave, False otherwise.
+
+            Behavior:
+                - Moves each enemy (turning it on waypoint transitions) and updates its slow effect.
+                - Enemies that reached the endpoint damage the player, dead enemies reward the player.
+                - World counters are updated once with the totals of the whole frame.
+                - Finished enemies are only flagged during the pass and removed together at the end,
+                  then kept in the pool.
+        """
+        missed_enemies = 0
+        damage_taken = 0
+        killed_enemies = 0
+        kill_reward = 0
+        finished = []
+
+        for enemy in self:
+            if enemy.move():  # enemy has reached to the end of the path
+                missed_enemies += 1
+                damage_taken += enemy.damage_inflicted
+                enemy.finished = True
+                finished.append(enemy)
+                continue
+            if enemy.health <= 0:  # same test as check_if_alive, inlined because it runs for every enemy
+                killed_enemies += 1
+                kill_reward += enemy.kill_reward
+                enemy.finished = True
+                finished.append(enemy)
+                continue
+            if enemy.is_slowed:  # only slowed enemies have a timer to check
+                enemy.update_slow_effect()
+
+        if finished:
+            self.remove(*finished)  # one bulk removal instead of a kill() per enemy
+            self.pool.extend(finished)  # recycled by spawn
+
+        world.health -= damage_taken
+        world.missed_enemies += missed_enemies
+        world.killed_enemies += killed_enemies
+        world.money += kill_reward
+
+        # the killed and missed counters only grow here, so the wave can only be completed by this update
+        return bool(finished) and world.is_wave_completed()
+
+    def draw_health_bars(self, surface):
+        """
+            Draws a health bar above every enemy to indicate its remaining health.
+
+            Args:
+                surface (pygame.Surface): The surface to draw the health bars on.
+
+            Behavior:
+                - Collects the background and fill of every bar first, then draws each layer with one
+                  `Surface.blits` call instead of two `pygame.draw.rect` calls per enemy.
+                - The fill is a pre-rendered bar whose width matches the remaining health.
+        """
+        backgrounds = []
+        fills = []
+        for enemy in self:
+            bar_x = enemy.rect.centerx - HEALTH_BAR_WIDTH // 2  # Centered horizontally relative to the enemy
+            bar_y = enemy.rect.top + HEALTH_BAR_OFFSET_Y
+            fill_width = min(HEALTH_BAR_WIDTH, max(0, int(enemy.health * enemy.health_bar_scale)))
+
+            # Change color based on slow effect
+            bar_fills = self.bar_fills_slowed if enemy.is_slowed else self.bar_fills
+
+            backgrounds.append((self.bar_background, (bar_x, bar_y)))
+            fills.append((bar_fills[fill_width], (bar_x, bar_y)))
+
+        surface.blits(backgrounds, doreturn=False)
+        surface.blits(fills, doreturn=False)
@@ -139,3 +139,18 @@ ENEMY_DATA = {
         "kill_reward": 25
     }
 }
+
+
+# ENEMY_DATA flattened into tuples indexed by enemy type id, so hot paths index a tuple
+# instead of doing two dict lookups with string keys
+ENEMY_TYPE_ID = {enemy_type: type_id for type_id, enemy_type in enumerate(ENEMY_DATA)}
+ENEMY_HEALTH = tuple(stats["health"] for stats in ENEMY_DATA.values())
+ENEMY_SPEED = tuple(stats["speed"] for stats in ENEMY_DATA.values())
+ENEMY_DAMAGE = tuple(stats["damage_inflicted"] for stats in ENEMY_DATA.values())
+ENEMY_KILL_REWARD = tuple(stats["kill_reward"] for stats in ENEMY_DATA.values())
+
+# Every wave of WAVE_ENEMY_DATA expanded into the enemy types it spawns, in the order of the dict,
+# so a new wave only has to copy and shuffle its list
+WAVE_ENEMY_LIST = tuple(
+    tuple(enemy_type for enemy_type, count in wave.items() for _ in range(count)) for wave in WAVE_ENEMY_DATA
+)
@@ -0,0 +1,20 @@
+import pygame
+
+# Per-frame values sampled once per game tick, so hot loops (enemies, buttons) read plain module
+# globals instead of calling into SDL for every sprite.
+now = 0  # pygame.time.get_ticks() at the start of the current frame
+mouse_left = False  # Whether the left mouse button is pressed in the current frame
+mouse_pos = (0, 0)  # pygame.mouse.get_pos() in the current frame, in display_surface coordinates
+
+
+def tick():
+    """
+    Samples the clock and the mouse once for the current frame.
+
+    Has to be called after the event queue was pumped (pygame.event.get()), so the mouse button
+    state matches the events handled in the same frame.
+    """
+    global now, mouse_left, mouse_pos
+    now = pygame.time.get_ticks()
+    mouse_left = pygame.mouse.get_pressed()[0]
+    mouse_pos = pygame.mouse.get_pos()
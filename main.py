@@ -1,14 +1,43 @@
 import os
 import pygame
-from pygame.math import Vector2
 import const as c
-from enemy import Enemy
+from enemy import EnemyGroup
 from world import World
 from turret import Turret
 from button import Button
-from turret_data import TURRET_DATA
 from enemy_data import WAVE_ENEMY_DATA
+import frame
 import json
+import logging
+from functools import lru_cache
+
+try:  # orjson is an optional, faster JSON parser, the standard library json is used when it is not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)  # debug messages of the game, silent unless logging is configured
+LOG_LEVEL_ENV = "TOWER_DEFENSE_LOG_LEVEL"  # environment variable with the log level used when running main.py
+
+
+@lru_cache(maxsize=256)
+def render_text(font, text, text_col):
+    """
+    Renders text with antialiasing, reusing the surface when the same text was rendered before.
+
+    Most of the text in the game (labels, prices, health, money, wave) stays the same for many frames,
+    so it only has to be rasterized again when it changes. The cache is limited to the 256 most recently
+    used texts.
+
+    Args:
+        font (pygame.font.Font): Font used for rendering.
+        text (str): The text to render.
+        text_col: Color of the text.
+
+    Returns:
+        pygame.Surface: The rendered text. It is shared, so it must not be modified.
+    """
+    return font.render(text, True, text_col)
 
 
 class Game:
@@ -19,6 +48,7 @@ class Game:
            ROWS (int): Number of rows in the tile map.
            COLS (int): Number of columns in the tile map.
            TILE_SIZE (int): Size of each tile in pixels.
+           _TILE_SHIFT (int): log2 of TILE_SIZE if it is a power of two, None otherwise.
            SCREEN_WIDTH (int): Width of the game screen.
            SCREEN_HEIGHT (int): Height of the game screen.
            SIDE_PANEL (int): Width of the side panel.
@@ -34,15 +64,33 @@ class Game:
            placing_turrets (bool): Whether the player is placing turrets.
            selected_turret (Turret): Currently selected turret.
            turret_buy_costs (dict): Cost of buying turrets by type.
-           occupied_tiles (dict): Dictionary of all occupied tiles.
+           turret_buy_buttons (list): (button, turret type) pairs of the turret buy buttons.
+           occupied_tiles (list): Turret placed on each tile, indexed by the tile number (None for a free tile).
            world (World): Instance of the game world.
+           game_over_rect (pygame.Rect): Central rectangle holding the game over message and restart button.
+           _play_area_rect (pygame.Rect): Screen area (edges included) where the placement cursor is shown.
+           _game_assets_loaded (bool): Whether the game assets and buttons were already loaded.
            display_surface (pygame.Surface): Main display surface for the game.
            screen (pygame.Surface): Internal game screen surface.
-           enemy_group (pygame.sprite.Group): Group of enemy sprites.
+           menu_static_surface (pygame.Surface): Background, title, map images and labels of the menu.
+           side_panel_surface (pygame.Surface): Background and turret prices of the side panel.
+           _map_sx (float): Horizontal scale from display_surface to screen coordinates.
+           _map_sy (float): Vertical scale from display_surface to screen coordinates.
+           mapped_mouse_pos (tuple): Mouse position in screen coordinates, mapped once per frame in draw().
+           _presented_view (tuple): (state, difficulty index) of the menu or game over screen shown in the window.
+           _hud_values (tuple): (health, money, wave) shown by `_hud_blits`, None before the first game frame.
+           _hud_blits (list): (text surface, position) of the health, money and wave lines, rendered on change.
+           enemy_atlas (pygame.Surface): Single surface holding the images of all enemy types.
+           enemy_images (dict): Subsurfaces of `enemy_atlas` by enemy type.
+           enemy_group (EnemyGroup): Group of enemy sprites.
            turret_group (pygame.sprite.Group): Group of turret sprites.
-           turret_spritesheets (list): Sprite sheets for standard turrets.
-           camo_turret_spritesheets (list): Sprite sheets for camo turrets.
-           purple_turret_spritesheets (list): Sprite sheets for purple turrets.
+           turret_atlas (pygame.Surface): All level sprite sheets of standard turrets stacked vertically.
+           camo_turret_atlas (pygame.Surface): All level sprite sheets of camo turrets stacked vertically.
+           purple_turret_atlas (pygame.Surface): All level sprite sheets of purple turrets stacked vertically.
+           turret_spritesheets (list): Sprite sheets for standard turrets (subsurfaces of turret_atlas).
+           camo_turret_spritesheets (list): Sprite sheets for camo turrets (subsurfaces of camo_turret_atlas).
+           purple_turret_spritesheets (list): Sprite sheets for purple turrets (subsurfaces of purple_turret_atlas).
+           _cursor_by_type (dict): (cursor image, cursor rect) pairs of the placement cursors by turret type.
 
        Methods:
            __init__():
@@ -51,21 +99,45 @@ class Game:
            load_menu_images():
                Loads and prepares map images for the menu.
 
+           load_menu_assets():
+               Loads the difficulty images and creates the difficulty button shown in the menu.
+
+           load_game_assets():
+               Loads the game assets and creates the game buttons the first time a map is selected.
+
            load_images():
                Loads all necessary game assets, including turrets and enemies.
 
+           pack_images(images, vertical=False):
+               Packs several images into one atlas surface and returns subsurfaces of it.
+
            load_fonts():
-               Loads fonts for displaying text on the screen.
+               Loads fonts and renders the static menu labels.
+
+           create_menu_surface():
+               Composites the static part of the menu into one surface.
+
+           create_side_panel_surface():
+               Composites the side panel background and turret prices into one surface.
+
+           render_hud(health, money, level):
+               Renders the health, money and wave lines of the side panel, ready for one blits call.
 
            load_level_data(map_number):
                Loads the JSON data for the selected map.
 
            create_buttons():
-               Creates all necessary game buttons.
+               Creates all necessary game buttons (except the difficulty button of the menu).
+
+           start_turret_placement(turret_type):
+               Enables the turret placement mode for the given turret type.
 
            draw_text(text, font, text_col, x, y):
                Draws text on the screen.
 
+           get_mouse_tile(mapped_mouse_pos):
+               Converts the mapped mouse position into tile grid coordinates.
+
            create_turret(mapped_mouse_pos):
                Creates a turret at the specified position.
 
@@ -84,6 +156,9 @@ class Game:
            update():
                Updates the game logic.
 
+           complete_wave():
+               Rewards the player and prepares the next wave, or ends the game after the last wave.
+
            skip_wave():
                Skips the current wave and penalizes the player's health.
 
@@ -102,6 +177,9 @@ class Game:
            run():
                Runs the main game loop.
 
+           update_mouse_scale():
+               Recalculates the factors for mapping the mouse position to internal screen coordinates.
+
            map_mouse_cursor(pos):
                Maps the mouse position from the display surface to internal screen coordinates.
        """
@@ -123,6 +201,8 @@ class Game:
         self.ROWS = c.ROWS
         self.COLS = c.COLS
         self.TILE_SIZE = c.TILE_SIZE
+        # Power of two tile sizes allow a bit shift instead of a division in the tile math, None otherwise
+        self._TILE_SHIFT = self.TILE_SIZE.bit_length() - 1 if self.TILE_SIZE & (self.TILE_SIZE - 1) == 0 else None
 
         # Screen settings
         self.SCREEN_WIDTH = c.TILE_SIZE * c.COLS
@@ -136,6 +216,11 @@ class Game:
         # Internal game surface
         self.screen = pygame.Surface((self.SCREEN_WIDTH + self.SIDE_PANEL, self.SCREEN_HEIGHT))
         pygame.display.set_caption("Tower Defense - Norbert Fila")
+        self.update_mouse_scale()
+        self.mapped_mouse_pos = (0, 0)
+        self._presented_view = None  # (state, difficulty) of the static screen currently shown in the window
+        self._hud_values = None  # (health, money, wave) last rendered into _hud_blits
+        self._hud_blits = None
 
         # Game states
         self.state = "menu"  # Possible states: menu, game, game_over
@@ -169,23 +254,34 @@ class Game:
         self.BACKGROUND_COLOR = (255, 255, 255)
         self.SIDE_PANEL_COLOR = (50, 50, 50)  # Dark Grey
 
-        # Load assets
-        self.load_images()
+        # Load assets, game assets are loaded only once the player selects a map
+        self.load_menu_assets()
         self.load_fonts()
+        self.create_menu_surface()
+        self.create_side_panel_surface()
+        self._game_assets_loaded = False
 
         # Create sprite groups
-        self.enemy_group = pygame.sprite.Group()
+        self.enemy_group = EnemyGroup()
         self.turret_group = pygame.sprite.Group()
 
-        # Create buttons
-        self.create_buttons()
-
-        # Dictionary of all occupied tiles
-        self.occupied_tiles = {}
+        # Turret placed on each tile by tile number, None for a free tile
+        self.occupied_tiles = [None] * (self.ROWS * self.COLS)
 
         # Initialize world as None
         self.world = None
 
+        # Central rectangle of the game over screen
+        self.game_over_rect = pygame.Rect(
+            (self.SCREEN_WIDTH + self.SIDE_PANEL) // 2 - 200,
+            self.SCREEN_HEIGHT // 2 - 100,
+            400,
+            200,
+        )
+
+        # Play area including its right and bottom edge, the mapped mouse position is never negative
+        self._play_area_rect = pygame.Rect(0, 0, self.SCREEN_WIDTH + 1, self.SCREEN_HEIGHT + 1)
+
     def load_menu_images(self):
         """
         Loads and prepares map images for the menu.
@@ -193,6 +289,7 @@ class Game:
         Behavior:
             - Loads images for each map and creates bordered versions.
             - Calculates their positions for rendering in the menu.
+            - Stores the left edge and step of the map strip for hit testing clicks.
         """
         # List of map names available in the menu
         maps = ["MAP1", "MAP2", "MAP3"]
@@ -212,8 +309,7 @@ class Game:
         y_position = self.SCREEN_HEIGHT // 2
 
         # Iterate over each map with its corresponding index
-        for map_index in range(len(maps)):
-            map_name = maps[map_index]
+        for map_index, map_name in enumerate(maps):
             map_image_path = f"levels/{map_name}/{map_name.lower()}.png"  # e.g. 'levels/MAP1/map1.png'
 
             # Scaling map image
@@ -252,24 +348,30 @@ class Game:
             # Add the position rectangle to the list of menu map rectangles
             self.menu_map_rects.append(rect)
 
+        # The maps lie on one horizontal strip in equal steps, so a click can be mapped to a map index directly
+        self._menu_x0 = self.menu_map_rects[0].left
+        self._menu_step = spacing + full_image_size[0]
+
     def load_images(self):
         """
         Loads all necessary game assets.
 
         Behavior:
             - Loads images for enemies, turrets, and buttons.
-            - Creates sprite sheets for turrets at different levels.
+            - Packs the enemy images into one atlas surface.
+            - Creates sprite sheets for turrets at different levels, stacked into one atlas per turret type.
         """
-        # Load map image
-        self.map_image = pygame.image.load("levels/MAP3/map3.png").convert_alpha()
-
-        # Load enemy images
-        self.enemy_images = {
-            "weak": pygame.image.load("assets/images/enemies/enemy_1.png").convert_alpha(),
-            "medium": pygame.image.load("assets/images/enemies/enemy_2.png").convert_alpha(),
-            "strong": pygame.image.load("assets/images/enemies/enemy_3.png").convert_alpha(),
-            "elite": pygame.image.load("assets/images/enemies/enemy_4.png").convert_alpha(),
-        }
+        # Load map image, the maps are fully opaque so they are converted without alpha for plain copy blits
+        self.map_image = pygame.image.load("levels/MAP3/map3.png").convert()
+
+        # Load enemy images and pack them into one atlas, enemies use its subsurfaces
+        enemy_types = ["weak", "medium", "strong", "elite"]
+        enemy_images = [
+            pygame.image.load(f"assets/images/enemies/enemy_{x}.png").convert_alpha()
+            for x in range(1, len(enemy_types) + 1)
+        ]
+        self.enemy_atlas, enemy_subsurfaces = self.pack_images(enemy_images)
+        self.enemy_images = dict(zip(enemy_types, enemy_subsurfaces))
 
         # Load turret cursor images
         self.cursor_standard = pygame.image.load(
@@ -281,37 +383,42 @@ class Game:
         self.cursor_purple_turret = pygame.image.load(
             "assets/images/turrets/purple/purple_cursor_turret.png"
         ).convert_alpha()
+        # Placement cursor of each turret type with its rect, so placement mode only has to move the rect
+        self._cursor_by_type = {
+            "standard": (self.cursor_standard, self.cursor_standard.get_rect()),
+            "camo": (self.cursor_camo_turret, self.cursor_camo_turret.get_rect()),
+            "purple": (self.cursor_purple_turret, self.cursor_purple_turret.get_rect()),
+        }
 
         # Loading Sprite sheets #
+        # The sheets of all 4 levels of a turret type are stacked into one tall atlas,
+        # every level sheet is a subsurface of it, so turrets use them like separate sheets
 
         # Standard Turret sprite sheets
-        self.turret_spritesheets = []
+        turret_sheets = []
         for x in range(1, 5):  # 4 levels
             turret_sheet = pygame.image.load(f"assets/images/turrets/standard/turret_{x}.png").convert_alpha()
-            self.turret_spritesheets.append(turret_sheet)
+            turret_sheets.append(turret_sheet)
+        self.turret_atlas, self.turret_spritesheets = self.pack_images(turret_sheets, vertical=True)
 
         # Camo Turret sprite sheets
-        self.camo_turret_spritesheets = []
+        turret_sheets = []
         for x in range(1, 5):  # 4 levels
             turret_sheet = pygame.image.load(f"assets/images/turrets/camo/turret_{x}.png").convert_alpha()
-            self.camo_turret_spritesheets.append(turret_sheet)
+            turret_sheets.append(turret_sheet)
+        self.camo_turret_atlas, self.camo_turret_spritesheets = self.pack_images(turret_sheets, vertical=True)
 
         # Purple Turret sprite sheets
-        self.purple_turret_spritesheets = []
+        turret_sheets = []
         for x in range(1, 5):  # 4 levels
             turret_sheet = pygame.image.load(f"assets/images/turrets/purple/turret_{x}.png").convert_alpha()
-            self.purple_turret_spritesheets.append(turret_sheet)
+            turret_sheets.append(turret_sheet)
+        self.purple_turret_atlas, self.purple_turret_spritesheets = self.pack_images(turret_sheets, vertical=True)
 
-        # Load button images
-        self.buy_turret_image = pygame.image.load(
-            "assets/images/turrets/standard/cursor_turret.png"
-        ).convert_alpha()
-        self.camo_buy_turret_image = pygame.image.load(
-            "assets/images/turrets/camo/camo_cursor_turret.png"
-        ).convert_alpha()
-        self.buy_purple_turret_image = pygame.image.load(
-            "assets/images/turrets/purple/purple_cursor_turret.png"
-        ).convert_alpha()
+        # Load button images (buy buttons show the same images as the turret cursors, so they are shared)
+        self.buy_turret_image = self.cursor_standard
+        self.camo_buy_turret_image = self.cursor_camo_turret
+        self.buy_purple_turret_image = self.cursor_purple_turret
         self.cancel_image = pygame.image.load("assets/images/buttons/cancel.png").convert_alpha()
         self.upgrade_image = pygame.image.load("assets/images/buttons/upgrade_turret.png").convert_alpha()
         self.tidal_upgrade_image = pygame.image.load(
@@ -322,6 +429,14 @@ class Game:
         self.sell_image = pygame.image.load("assets/images/buttons/sell.png").convert_alpha()
         self.back_to_menu_image = pygame.image.load("assets/images/buttons/back_to_menu.png").convert_alpha()
 
+    def load_menu_assets(self):
+        """
+        Loads the assets needed by the menu.
+
+        Behavior:
+            - Loads the difficulty images.
+            - Creates the difficulty button, starting with 'normal'.
+        """
         # Load difficulty images
         self.difficulty_images = []
         difficulty_image_paths = {
@@ -333,17 +448,141 @@ class Game:
             image = pygame.image.load(difficulty_image_paths[difficulty]).convert_alpha()
             self.difficulty_images.append(image)
 
+        self.difficulty_button = Button(
+            self.SCREEN_WIDTH // 2 + 150, 780, self.difficulty_images[self.current_difficulty_index], True
+        )  # 'normal' as default
+
+    def load_game_assets(self):
+        """
+        Loads the assets needed once a map is played.
+
+        Behavior:
+            - Called the first time a map is selected, so starting the game and staying in the menu
+              doesn't load (and convert) images which are not shown there.
+            - Loads enemy, turret and button images and creates the game buttons.
+        """
+        self.load_images()
+        self.create_buttons()
+        self._game_assets_loaded = True
+
+    @staticmethod
+    def pack_images(images, vertical=False):
+        """
+        Packs images side by side (or one below another) into a single atlas surface.
+
+        Args:
+            images (list): List of pygame surfaces to pack.
+            vertical (bool): Whether to stack the images vertically instead of placing them in a row.
+
+        Returns:
+            tuple: The atlas surface and a list of its subsurfaces, one for each of the given images, in order.
+
+        Behavior:
+            - All the images share one pixel buffer instead of each having its own surface.
+            - The subsurfaces can be used (blitted, rotated) exactly like the original images.
+        """
+        if vertical:
+            atlas_width = max(image.get_width() for image in images)
+            atlas_height = sum(image.get_height() for image in images)
+        else:
+            atlas_width = sum(image.get_width() for image in images)
+            atlas_height = max(image.get_height() for image in images)
+        atlas = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA).convert_alpha()
+        atlas.fill((0, 0, 0, 0))  # Transparent
+
+        subsurfaces = []
+        x = y = 0
+        for image in images:
+            atlas.blit(image, (x, y))
+            subsurfaces.append(atlas.subsurface((x, y, image.get_width(), image.get_height())))
+            if vertical:
+                y += image.get_height()
+            else:
+                x += image.get_width()
+        return atlas, subsurfaces
+
     def load_fonts(self):
         """
         Loads fonts for displaying text on the screen.
 
         Behavior:
             - Sets up small, medium, and large font styles.
+            - Renders the static menu labels once, so the menu only has to blit them.
         """
         self.text_font = pygame.font.SysFont("Consolas", 24, bold=True)
         self.small_text_font = pygame.font.SysFont("Consolas", 20, bold=True)
         self.large_font = pygame.font.SysFont("Consolas", 36)
 
+        # Menu title
+        self.menu_title_text = self.large_font.render("Select Map", True, "white")
+        self.menu_title_rect = self.menu_title_text.get_rect()
+        self.menu_title_rect.center = (self.SCREEN_WIDTH // 2 + 190, 280)
+
+        # "Difficulty" label, positioned above the difficulty button
+        self.difficulty_title = self.text_font.render("DIFFICULTY:", True, "white")
+        self.difficulty_title_rect = self.difficulty_title.get_rect()
+        self.difficulty_title_rect.center = (self.SCREEN_WIDTH // 2 + 200, 750)
+
+    def create_menu_surface(self):
+        """
+        Composites everything in the menu which never changes into one surface.
+
+        Behavior:
+            - Fills the background and blits the title, every map image and the difficulty label once.
+            - Only the difficulty button, which changes its image, is drawn on top of it every frame.
+        """
+        self.menu_static_surface = pygame.Surface((self.SCREEN_WIDTH + self.SIDE_PANEL, self.SCREEN_HEIGHT))
+        self.menu_static_surface.fill("dodgerblue")
+        self.menu_static_surface.blit(self.menu_title_text, self.menu_title_rect)
+
+        # Blit all map images at their positions
+        for img, rect in zip(self.menu_map_images, self.menu_map_rects):
+            self.menu_static_surface.blit(img, rect)
+
+        # "Difficulty" label
+        self.menu_static_surface.blit(self.difficulty_title, self.difficulty_title_rect)
+
+    def create_side_panel_surface(self):
+        """
+        Composites the static part of the side panel into one surface.
+
+        Behavior:
+            - Fills the panel background and draws the prices below the turret buy buttons once.
+            - Values which change (health, money, wave), buttons and messages are drawn on top every frame.
+        """
+        self.side_panel_surface = pygame.Surface((self.SIDE_PANEL, self.SCREEN_HEIGHT)).convert()
+        self.side_panel_surface.fill(self.SIDE_PANEL_COLOR)
+
+        # drawing prices of turrets, in the order of the buy buttons (standard, purple, camo)
+        for price_x, turret_type in ((45, "standard"), (45 + 90, "purple"), (45 + 90 + 90, "camo")):
+            price_text = render_text(self.text_font, f"{self.turret_buy_costs[turret_type]} $", "white")
+            self.side_panel_surface.blit(price_text, (price_x, 120 + 80))
+
+    def render_hud(self, health, money, level):
+        """
+        Renders the health, money and wave lines of the side panel.
+
+        Args:
+            health (int): Player's health.
+            money (int): Player's money.
+            level (int): Current wave.
+
+        Returns:
+            list: (text surface, position) pairs in screen coordinates, to be drawn with one `blits` call.
+
+        Behavior:
+            - The lines are 30 pixels apart, as when they were drawn one by one.
+            - The text surfaces keep their per-pixel alpha, so only the glyphs are drawn and anything
+              below them (e.g. a selected turret's range circle reaching into the panel) stays visible.
+        """
+        x = self.SCREEN_WIDTH + 20
+        return [
+            (self.text_font.render(text, True, "white"), (x, 20 + 30 * index))
+            for index, text in enumerate(
+                ("health: " + str(health), "money: " + str(money), "wave: " + str(level))
+            )
+        ]
+
     def load_level_data(self, map_number):
         """
         Loads the JSON data for the selected map.
@@ -353,19 +592,21 @@ class Game:
 
         Behavior:
             - Loads the .tmj file containing map data (in json format) and verifies its dimensions.
+            - Uses orjson for parsing if it is installed, the standard json module otherwise.
             - Prepares the map image for rendering.
         """
         tmj_path = f"levels/MAP{map_number}/map{map_number}.tmj"  # e.g., 'levels/MAP3/map3.tmj'
         png_path = f"levels/MAP{map_number}/map{map_number}.png"
 
-        # Open and load the JSON data for the map
-        with open(tmj_path) as file:
-            self.world_data = json.load(file)
+        # Open and load the JSON data for the map (parsed with orjson when available)
+        with open(tmj_path, "rb") as file:
+            raw_data = file.read()
+        self.world_data = orjson.loads(raw_data) if orjson is not None else json.loads(raw_data)
 
         print(f"World data for MAP{map_number}:", self.world_data)
 
-        # Load the map image using Pygame
-        self.map_image = pygame.image.load(png_path).convert_alpha()
+        # Load the map image using Pygame, the maps are fully opaque so they don't need per-pixel alpha
+        self.map_image = pygame.image.load(png_path).convert()
 
         # Verify tile map length
         tile_map_length = len(self.world_data["layers"][0]["data"])
@@ -386,9 +627,6 @@ class Game:
         self.restart_button = Button(self.SCREEN_WIDTH // 2 + 120, 480, self.restart_image, True)
         self.sell_button = Button(self.SCREEN_WIDTH + 240, 230, self.sell_image, True)
         self.back_to_menu_button = Button(self.SCREEN_WIDTH + 200, 800, self.back_to_menu_image, True)
-        self.difficulty_button = Button(
-            self.SCREEN_WIDTH // 2 + 150, 780, self.difficulty_images[1], True
-        )  # 'normal' as default
         self.skip_button = Button(
             self.SCREEN_WIDTH + 30,
             800,
@@ -396,12 +634,49 @@ class Game:
             True,
         )
 
+        # Buy buttons and the turret type each of them places, drawn and dispatched in one loop
+        self.turret_buy_buttons = [
+            (self.turret_button, "standard"),
+            (self.camo_turret_button, "camo"),
+            (self.purple_turret_button, "purple"),
+        ]
+
+    def start_turret_placement(self, turret_type):
+        """
+        Enables the turret placement mode for the given turret type.
+
+        Args:
+            turret_type (str): Type of the turret to place ("standard", "camo" or "purple").
+        """
+        self.placing_turrets = True
+        self.current_turret_type = turret_type
+        self.placement_message = f"Placing {turret_type.capitalize()} Turret"
+        self.message_timer = frame.now  # Resetting timer
+        logger.debug("%s Turret placement mode enabled.", turret_type.capitalize())
+
     def draw_text(self, text, font, text_col, x, y):
-        """Draws text on the screen."""
-        img = font.render(text, True, text_col)
+        """Draws text on the screen, the rendered text is cached by `render_text`."""
+        img = render_text(font, text, text_col)
         self.screen.blit(img, (x, y))
         return self.draw_text
 
+    def get_mouse_tile(self, mapped_mouse_pos):
+        """
+        Converts the pixel position of the mouse into grid coordinates.
+
+        Args:
+            mapped_mouse_pos (tuple): The mapped position of the mouse.
+
+        Returns:
+            tuple: The (x, y) coordinates of the tile under the mouse.
+
+        Behavior:
+            - Uses a bit shift when TILE_SIZE is a power of two and an integer division otherwise.
+        """
+        if self._TILE_SHIFT is not None:
+            return int(mapped_mouse_pos[0]) >> self._TILE_SHIFT, int(mapped_mouse_pos[1]) >> self._TILE_SHIFT
+        return int(mapped_mouse_pos[0]) // self.TILE_SIZE, int(mapped_mouse_pos[1]) // self.TILE_SIZE
+
     def create_turret(self, mapped_mouse_pos):
         """
         Creates a turret at the given position.
@@ -417,10 +692,9 @@ class Game:
             - Places a turret and deducts the cost from the player's money.
         """
         # Convert the pixel position of the mouse click into grid coordinates
-        mouse_tile_x = int(mapped_mouse_pos[0] // self.TILE_SIZE)
-        mouse_tile_y = int(mapped_mouse_pos[1] // self.TILE_SIZE)
+        mouse_tile_x, mouse_tile_y = self.get_mouse_tile(mapped_mouse_pos)
 
-        print(f"Turret placement attempt at tile ({mouse_tile_x}, {mouse_tile_y})")
+        logger.debug("Turret placement attempt at tile (%d, %d)", mouse_tile_x, mouse_tile_y)
 
         # Center the turret within the tile
         pixel_x = mouse_tile_x * self.TILE_SIZE + self.TILE_SIZE // 2
@@ -430,9 +704,9 @@ class Game:
         mouse_tile_num = (mouse_tile_y * self.COLS) + mouse_tile_x
 
         # Check if the tile is sand (tile ID 161)
-        if self.world.tile_map[mouse_tile_num] == 161:
+        if self.world.sand_mask[mouse_tile_num]:
             # Check if turret is not already placed in tile
-            if self.occupied_tiles.get(mouse_tile_num) is None:
+            if self.occupied_tiles[mouse_tile_num] is None:
                 # Choose appropriate sprite sheets based on turret type
                 if self.current_turret_type == "standard":
                     sprite_sheets = self.turret_spritesheets
@@ -452,22 +726,21 @@ class Game:
                     pixel_y,
                 )
                 self.turret_group.add(turret)
-                self.occupied_tiles[mouse_tile_num] = True
+                self.occupied_tiles[mouse_tile_num] = turret  # remembered for O(1) selection
                 self.placement_message = "Turret placed successfully!"
-                self.message_timer = pygame.time.get_ticks()
-                print(
-                    f"Turret placed at tile ({mouse_tile_x}, {mouse_tile_y}) as {self.current_turret_type} "
-                    f"turret"
+                self.message_timer = frame.now
+                logger.debug(
+                    "Turret placed at tile (%d, %d) as %s turret", mouse_tile_x, mouse_tile_y, self.current_turret_type
                 )
                 return True  # Turret successfully placed
             else:
                 self.placement_message = "Tile is already occupied!"
-                self.message_timer = pygame.time.get_ticks()
-                print(f"Tile ({mouse_tile_x}, {mouse_tile_y}) is already occupied.")
+                self.message_timer = frame.now
+                logger.debug("Tile (%d, %d) is already occupied.", mouse_tile_x, mouse_tile_y)
         else:
             self.placement_message = "Invalid placement area."
-            self.message_timer = pygame.time.get_ticks()
-            print(f"Tile ({mouse_tile_x}, {mouse_tile_y}) is not a valid placement area.")
+            self.message_timer = frame.now
+            logger.debug("Tile (%d, %d) is not a valid placement area.", mouse_tile_x, mouse_tile_y)
 
         return False  # Placement failed
 
@@ -480,24 +753,24 @@ class Game:
 
         Returns:
             Turret or None: The selected turret or None if no turret is found.
+
+        Behavior:
+            - Looks the turret up by the clicked tile number in `occupied_tiles`,
+              instead of comparing the tile with every placed turret.
         """
-        mouse_tile_x = int(mapped_mouse_pos[0] // self.TILE_SIZE)
-        mouse_tile_y = int(mapped_mouse_pos[1] // self.TILE_SIZE)
+        mouse_tile_x, mouse_tile_y = self.get_mouse_tile(mapped_mouse_pos)
 
-        for turret in self.turret_group:
-            if (mouse_tile_x, mouse_tile_y) == (
-                turret.mouse_tile_x,
-                turret.mouse_tile_y,
-            ):
-                print(f"Selected turret at tile ({mouse_tile_x}, {mouse_tile_y})")
-                return turret
-
-        print("No turret selected")
+        turret = self.occupied_tiles[mouse_tile_y * self.COLS + mouse_tile_x]
+        if turret is not None:
+            logger.debug("Selected turret at tile (%d, %d)", mouse_tile_x, mouse_tile_y)
+            return turret
+
+        logger.debug("No turret selected")
         return None
 
     def reset_occupied_tiles(self):
         """Clear all occupied tiles."""
-        self.occupied_tiles.clear()
+        self.occupied_tiles[:] = [None] * len(self.occupied_tiles)
 
     def restart_level(self):
         """Restart game variables."""
@@ -506,7 +779,7 @@ class Game:
         self.wave_started = False
         self.placing_turrets = False
         self.selected_turret = None
-        self.last_enemy_spawn = pygame.time.get_ticks()
+        self.last_enemy_spawn = frame.now
         self.current_turret_type = "standard"
 
         # Reset world instance
@@ -519,13 +792,13 @@ class Game:
         self.turret_group.empty()
 
         # Reset occupied tiles
-        self.occupied_tiles = {}
+        self.reset_occupied_tiles()
 
         # Clear placement message
         self.placement_message = ""
         self.message_timer = 0
 
-        print("Level restarted and player moved to Menu.")
+        logger.debug("Level restarted and player moved to Menu.")
 
     def handle_events(self):
         """
@@ -535,36 +808,43 @@ class Game:
             bool: False if the game should exit, True otherwise.
 
         Behavior:
+            - Samples the clock and mouse state for the current frame (see frame.py).
             - Processes user inputs for turret placement, map selection, and button clicks.
         """
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        frame.tick()  # sample clock and mouse once per frame, after the event queue has been pumped
+        for event in events:
             # Quit program
             if event.type == pygame.QUIT:
                 return False
             # Window resize
             if event.type == pygame.VIDEORESIZE:
                 self.display_surface = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                print(f"Window resized to: {event.w}x{event.h}")
+                self.update_mouse_scale()
+                self._presented_view = None  # the new window surface has to be drawn again
+                logger.debug("Window resized to: %dx%d", event.w, event.h)
+            if event.type == pygame.VIDEOEXPOSE:  # window contents were lost, present the screen again
+                self._presented_view = None
             # Mouse click
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left Mouse Button
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = frame.mouse_pos
                 # Map mouse position to internal screen coordinates
                 mapped_mouse_pos = self.map_mouse_cursor(mouse_pos)
 
                 if self.state == "menu":
-                    # Check if any map image was clicked
-                    for i in range(len(self.menu_map_rects)):
-                        rect = self.menu_map_rects[i]
-                        if rect.collidepoint(mapped_mouse_pos):
-                            self.selected_map = i + 1  # Maps are 1, 2, 3
-                            print(f"Map {self.selected_map} selected.")
-                            self.load_level_data(self.selected_map)
-                            # Create world instance
-                            self.world = World(self.world_data, self.map_image)
-                            self.world.process_data()
-                            self.world.process_enemies()
-                            self.state = "game"  # Transition to game
-                            break
+                    # Check if any map image was clicked, only the map under the cursor's strip step can be hit
+                    i = int((mapped_mouse_pos[0] - self._menu_x0) // self._menu_step)
+                    if 0 <= i < len(self.menu_map_rects) and self.menu_map_rects[i].collidepoint(mapped_mouse_pos):
+                        self.selected_map = i + 1  # Maps are 1, 2, 3
+                        logger.debug("Map %d selected.", self.selected_map)
+                        if not self._game_assets_loaded:
+                            self.load_game_assets()
+                        self.load_level_data(self.selected_map)
+                        # Create world instance
+                        self.world = World(self.world_data, self.map_image)
+                        self.world.process_data()
+                        self.world.process_enemies()
+                        self.state = "game"  # Transition to game
                     else:
                         # Difficulty button
                         if self.difficulty_button.draw(self.screen, mapped_mouse_pos):
@@ -577,7 +857,7 @@ class Game:
                             self.difficulty_button.image = self.difficulty_images[
                                 self.current_difficulty_index
                             ]
-                            print(f"Difficulty set to {self.selected_difficulty.capitalize()}.")
+                            logger.debug("Difficulty set to %s.", self.selected_difficulty.capitalize())
 
                 elif self.state == "game":
                     # Check if mouse is on the game area
@@ -592,16 +872,19 @@ class Game:
                                     )
                             else:
                                 self.placement_message = "Not enough money to place turret!"
-                                self.message_timer = pygame.time.get_ticks()
-                                print("Not enough money to place turret.")
+                                self.message_timer = frame.now
+                                logger.debug("Not enough money to place turret.")
                         else:
+                            # Only the previously selected turret can have its flag set, so only it is reset
+                            if self.selected_turret:
+                                self.selected_turret.selected = False
                             self.selected_turret = self.select_turret(mapped_mouse_pos)
-                            for turret in self.turret_group:
-                                turret.selected = False  # Reset flag for all turrets
                             if self.selected_turret:
                                 self.selected_turret.selected = True
-                                print(
-                                    f"Turret selected at position ({self.selected_turret.x}, {self.selected_turret.y})"
+                                logger.debug(
+                                    "Turret selected at position (%d, %d)",
+                                    self.selected_turret.x,
+                                    self.selected_turret.y,
                                 )
 
         return True
@@ -613,20 +896,51 @@ class Game:
         Behavior:
             - Checks for win/loss conditions.
             - Updates enemy and turret groups.
+            - Has the world bucket the enemies into its spatial grid, so turrets only check enemies near them.
+            - Completes the wave on the frame the enemy group reports its last enemy was removed.
         """
         if self.state == "game":
             if self.world.health <= 0:
                 self.game_status = -1  # Indicate loss
                 self.state = "game_over"  # Transition to game_over state
-                print("Transitioning to Game Over state.")
+                logger.debug("Transitioning to Game Over state.")
             elif self.world.level > self.MAX_LEVELS:
                 self.game_status = 1  # Indicate win
                 self.state = "game_over"  # Transition to game_over state
-                print("Transitioning to Game Over state.")
+                logger.debug("Transitioning to Game Over state.")
             else:
                 # Continue updating enemies and turrets
-                self.enemy_group.update(self.world)
-                self.turret_group.update(self.enemy_group)
+                wave_completed = self.enemy_group.update(self.world)
+
+                # Rebuild the spatial grid after the enemies moved, then let the turrets query it
+                self.world.build_enemy_grid(self.enemy_group)
+                self.turret_group.update(self.world.enemy_grid)
+
+                if wave_completed:
+                    self.complete_wave()
+
+    def complete_wave(self):
+        """
+        Handle the end of a wave, called once by `update` when the last enemy of the wave was removed.
+
+        Behavior:
+            - After the last level the game is won and moves to the game over state.
+            - Otherwise the player is rewarded, the next wave is prepared and tidal upgrades are reset.
+        """
+        if self.world.level > self.MAX_LEVELS:
+            self.game_status = 1  # Win
+            self.state = "game_over"  # Transition to game_over state
+            logger.debug("Transitioning to Game Over state.")
+        else:
+            self.world.money += c.WAVE_COMPLETE_REWARD
+            self.wave_started = False
+            self.last_enemy_spawn = frame.now
+            self.world.reset_values()
+            self.world.process_enemies()
+            for turret in self.turret_group:
+                turret.reset_tidal_upgrade()
+
+            logger.debug("Wave completed! Level increased to %d", self.world.level)
 
     def skip_wave(self):
         """
@@ -638,22 +952,17 @@ class Game:
         """
         if not self.wave_started:
             return
-        total_penalty = 0
-        enemies_to_skip = list(self.enemy_group)  # create a copy of current enemy group
-
-        for enemy in enemies_to_skip:
-            # Use each enemy's damage_inflicted as the penalty for skipping it
-            total_penalty += enemy.damage_inflicted
-            enemy.kill()  # Remove the enemy
+        # Use each enemy's damage_inflicted as the penalty for skipping it (summed up by the group)
+        total_penalty = self.enemy_group.total_damage
+        skipped_enemies = len(self.enemy_group)
+        self.enemy_group.empty()  # enemies only belong to this group, so emptying it removes all of them at once
 
         self.world.health -= total_penalty
-        print(
-            f"Skiped wave: {len(enemies_to_skip)} enemies removed; total health penalty: {total_penalty}."
-        )
+        logger.debug("Skiped wave: %d enemies removed; total health penalty: %d.", skipped_enemies, total_penalty)
 
         self.world.money += c.WAVE_COMPLETE_REWARD
         self.wave_started = False
-        self.last_enemy_spawn = pygame.time.get_ticks()
+        self.last_enemy_spawn = frame.now
         self.world.reset_values()
         self.world.process_enemies()
         for turret in self.turret_group:
@@ -661,45 +970,18 @@ class Game:
 
     def draw_menu(self):
         """Draw the map selection menu."""
-        self.screen.fill("dodgerblue")
-        title_text = self.large_font.render("Select Map", True, "white")
-        title_rect = title_text.get_rect()
-        title_rect.center = (self.SCREEN_WIDTH // 2 + 190, 280)
-        self.screen.blit(title_text, title_rect)
-
-        # Iterate through all map images
-        for i in range(len(self.menu_map_images)):
-            img = self.menu_map_images[i]  # Get the current map image
-            rect = self.menu_map_rects[i]  # Get the corresponding position rectangle
-            self.screen.blit(img, rect)
-
-        # Drawing "Difficulty" label
-        difficulty_title = self.text_font.render("DIFFICULTY:", True, "white")
-        difficulty_rect = difficulty_title.get_rect()
-        # Position the label above the difficulty button
-        difficulty_rect.center = (self.SCREEN_WIDTH // 2 + 200, 750)
-        self.screen.blit(difficulty_title, difficulty_rect)
+        # Background, title, map images and the difficulty label (composited once in create_menu_surface)
+        self.screen.blit(self.menu_static_surface, (0, 0))
 
         # Drawing the difficulty button
-        self.difficulty_button.draw(self.screen, self.map_mouse_cursor(pygame.mouse.get_pos()))
+        self.difficulty_button.draw(self.screen, self.mapped_mouse_pos)
 
     def draw_game_over(self):
         """Draw the game over screen."""
-        print("GAME OVER")
-
-        overlay = pygame.Surface(
-            (self.SCREEN_WIDTH + self.SIDE_PANEL, self.SCREEN_HEIGHT),
-            pygame.SRCALPHA,
-        )
-        self.screen.blit(overlay, (0, 0))
+        logger.debug("GAME OVER")
 
         # Draw a central rectangle for the Game Over message and buttons
-        game_over_rect = pygame.Rect(
-            (self.SCREEN_WIDTH + self.SIDE_PANEL) // 2 - 200,
-            self.SCREEN_HEIGHT // 2 - 100,
-            400,
-            200,
-        )
+        game_over_rect = self.game_over_rect
         pygame.draw.rect(self.screen, "dodgerblue", game_over_rect, border_radius=30)
 
         # Display the game over message
@@ -719,280 +1001,205 @@ class Game:
         )
 
         # Draw the Restart Button
-        if self.restart_button.draw(self.screen, self.map_mouse_cursor(pygame.mouse.get_pos())):
+        if self.restart_button.draw(self.screen, self.mapped_mouse_pos):
             self.restart_level()
-            print("Restart button clicked. Returning to Menu.")
+            logger.debug("Restart button clicked. Returning to Menu.")
 
     def draw_game(self):
         """
         Draw all game elements.
 
         Behavior:
-            - Renders the game world, turrets, enemies, and side panel information."""
-        # Fill the main game area with background color
-        self.screen.fill(self.BACKGROUND_COLOR)
-
-        # Fill the side panel with desired color
-        side_panel_rect = pygame.Rect(self.SCREEN_WIDTH, 0, self.SIDE_PANEL, self.SCREEN_HEIGHT)
-        self.screen.fill(self.SIDE_PANEL_COLOR, side_panel_rect)
-
-        # Draw the game world (map, paths, etc.)
-        self.world.draw(self.screen)
+            - Renders the game world, turrets, enemies, and side panel information.
+            - The attributes read many times per frame are bound to locals once at the top.
+        """
+        screen = self.screen
+        world = self.world
+        screen_width = self.SCREEN_WIDTH
+        text_font = self.text_font
+        selected_turret = self.selected_turret
+        now = frame.now
+        # Current mouse position, mapped once per frame in draw()
+        mapped_mouse_pos = self.mapped_mouse_pos
+
+        # Side panel background with the turret prices (composited once in create_side_panel_surface)
+        screen.blit(self.side_panel_surface, (screen_width, 0))
+
+        # Draw the game world (map, paths, etc.), the opaque map and the side panel together cover the
+        # whole screen, so it doesn't have to be filled with the background color first
+        world.draw(screen)
 
         # Draw enemies
-        self.enemy_group.draw(self.screen)
+        self.enemy_group.draw(screen)
 
         # Draw health bars for each enemy
-        for enemy in self.enemy_group:
-            enemy.draw_health_bar(self.screen)
-
-        # Draw turrets
-        for turret in self.turret_group:
-            turret.draw(self.screen)  # Custom draw method
-
-        # Draw side panel info
-        self.draw_text(
-            "health: " + str(self.world.health),
-            self.text_font,
-            "white",
-            self.SCREEN_WIDTH + 20,
-            20,
-        )
-        self.draw_text(
-            "money: " + str(self.world.money),
-            self.text_font,
-            "white",
-            self.SCREEN_WIDTH + 20,
-            50,
-        )
-        self.draw_text(
-            "wave: " + str(self.world.level),
-            self.text_font,
-            "white",
-            self.SCREEN_WIDTH + 20,
-            80,
-        )
-        # drawing prices of turrets
+        self.enemy_group.draw_health_bars(screen)
 
-        self.draw_text(
-            "200 $",
-            self.text_font,
-            "white",
-            self.SCREEN_WIDTH + 45,
-            120 + 80,
-        )
-        self.draw_text(
-            "500 $",
-            self.text_font,
-            "white",
-            self.SCREEN_WIDTH + 45 + 90,
-            120 + 80,
-        )
-        self.draw_text(
-            "200 $",
-            self.text_font,
-            "white",
-            self.SCREEN_WIDTH + 45 + 90 + 90,
-            120 + 80,
-        )
+        # Draw turrets, their images are only rotated when they change, so all of them are drawn in one call
+        screen.blits([(turret.image, turret.rect) for turret in self.turret_group], doreturn=False)
+        if selected_turret:
+            selected_turret.draw_range(screen)
 
-        # Get and map current mouse position
-        mouse_pos = pygame.mouse.get_pos()
-        mapped_mouse_pos = self.map_mouse_cursor(mouse_pos)
+        # Draw side panel info, the three lines are only rendered again when one of the values changed
+        hud_values = (world.health, world.money, world.level)
+        if hud_values != self._hud_values:
+            self._hud_values = hud_values
+            self._hud_blits = self.render_hud(*hud_values)
+        screen.blits(self._hud_blits, doreturn=False)
 
         # Check if wave has been started
         if self.state == "game":
             if self.wave_started:
-                if pygame.time.get_ticks() - self.last_enemy_spawn > c.SPAWN_COOLDOWN:
-                    if self.world.spawned_enemies < len(self.world.enemy_list):
-                        # Spawn enemies
-                        enemy_type = self.world.enemy_list[self.world.spawned_enemies]
-                        enemy = Enemy(
+                if now - self.last_enemy_spawn > c.SPAWN_COOLDOWN:
+                    if world.enemy_queue:
+                        # Spawn enemies, the group reuses removed enemies when it can
+                        enemy_type = world.enemy_queue.popleft()
+                        self.enemy_group.spawn(
                             enemy_type,
-                            self.world.waypoints,
+                            world.waypoints,
+                            world.path,
                             self.enemy_images,
                             difficulty=self.selected_difficulty,
                         )
-                        self.enemy_group.add(enemy)
-                        self.world.spawned_enemies += 1
-                        self.last_enemy_spawn = pygame.time.get_ticks()
-                        print(f"Enemy spawned: {enemy_type}, Total enemies: {len(self.enemy_group)}")
+                        world.spawned_enemies += 1
+                        self.last_enemy_spawn = now
+                        logger.debug("Enemy spawned: %s, Total enemies: %d", enemy_type, len(self.enemy_group))
             else:
-                if self.begin_button.draw(self.screen, mapped_mouse_pos):  # Button clicked
+                if self.begin_button.draw(screen, mapped_mouse_pos):  # Button clicked
                     self.wave_started = True
-                    print("Wave started.")
+                    logger.debug("Wave started.")
 
             # pygame.draw.lines(self.screen, "grey0", False, self.world.waypoints)
-            # Check if the wave is completed
-            if self.world.is_wave_completed():
-                if self.world.level > self.MAX_LEVELS:
-                    self.game_status = 1  # Win
-                    self.state = "game_over"  # Transition to game_over state
-                    print("Transitioning to Game Over state.")
-                else:
-                    self.world.money += c.WAVE_COMPLETE_REWARD
-                    self.wave_started = False
-                    self.last_enemy_spawn = pygame.time.get_ticks()
-                    self.world.reset_values()
-                    self.world.process_enemies()
-                    for turret in self.turret_group:
-                        turret.reset_tidal_upgrade()
-
-                    print(f"Wave completed! Level increased to {self.world.level}")
+            # Wave completion is handled by update, when the last enemy of the wave is removed
 
             # Draw Turret Buttons
-            if self.turret_button.draw(self.screen, mapped_mouse_pos):  # Returns True if clicked
-                self.placing_turrets = True
-                self.current_turret_type = "standard"
-                self.placement_message = "Placing Standard Turret"
-                self.message_timer = pygame.time.get_ticks()  # Resetting timer
-                print("Standard Turret placement mode enabled.")
-
-            if self.camo_turret_button.draw(self.screen, mapped_mouse_pos):
-                self.placing_turrets = True
-                self.current_turret_type = "camo"
-                self.placement_message = "Placing Camo Turret"
-                self.message_timer = pygame.time.get_ticks()
-                print("Camo Turret placement mode enabled.")
-
-            if self.purple_turret_button.draw(self.screen, mapped_mouse_pos):
-                self.placing_turrets = True
-                self.current_turret_type = "purple"
-                self.placement_message = "Placing Purple Turret"
-                self.message_timer = pygame.time.get_ticks()
-                print("Purple Turret placement mode enabled.")
+            for button, turret_type in self.turret_buy_buttons:
+                if button.draw(screen, mapped_mouse_pos):  # Returns True if clicked
+                    self.start_turret_placement(turret_type)
 
             # Check if the turret placement mode is active
             if self.placing_turrets:
                 # Use mapped_mouse_pos for internal screen
                 cursor_pos = mapped_mouse_pos
 
-                # Assign the appropriate cursor image based on the current turret type
-                if self.current_turret_type == "standard":
-                    current_cursor = self.cursor_standard  # Standard cursor
-                elif self.current_turret_type == "camo":
-                    current_cursor = self.cursor_camo_turret  # Camo cursor
-                elif self.current_turret_type == "purple":
-                    current_cursor = self.cursor_purple_turret  # Purple cursor
-                else:
-                    current_cursor = self.cursor_standard  # Default to standard
-
-                cursor_rect = current_cursor.get_rect()
+                # Assign the appropriate cursor image based on the current turret type, default to standard
+                cursor_by_type = self._cursor_by_type
+                current_cursor, cursor_rect = cursor_by_type.get(self.current_turret_type, cursor_by_type["standard"])
                 cursor_rect.midtop = cursor_pos  # Align the bottom center of the cursor image with cursor_pos
 
                 # print(f"[DEBUG] Cursor Position: {cursor_pos}, Turret Rect: {cursor_rect}")
 
                 # Only display the turret cursor within the game screen area
-                if cursor_pos[0] <= self.SCREEN_WIDTH and cursor_pos[1] <= self.SCREEN_HEIGHT:
-                    self.screen.blit(current_cursor, cursor_rect)  # Use the selected cursor image
+                if self._play_area_rect.collidepoint(cursor_pos):
+                    screen.blit(current_cursor, cursor_rect)  # Use the selected cursor image
 
                 # Draw and handle the cancel button
-                if self.cancel_button.draw(self.screen, mapped_mouse_pos):
+                if self.cancel_button.draw(screen, mapped_mouse_pos):
                     self.placing_turrets = False
                     self.placement_message = "Turret placement canceled."
-                    self.message_timer = pygame.time.get_ticks()
-                    print("Turret placement mode disabled.")
+                    self.message_timer = now
+                    logger.debug("Turret placement mode disabled.")
 
             # IF turret is selected
-            if self.selected_turret:
+            if selected_turret:
                 # Draw UPGRADE button for standard upgrade
-                if self.selected_turret.turret_level < len(TURRET_DATA[self.selected_turret.turret_type]):
-                    if self.upgrade_button.draw(self.screen, mapped_mouse_pos):
-                        if not self.selected_turret.tidal_active:
-                            if self.world.money >= c.UPGRADE_COST:
-                                self.world.money -= c.UPGRADE_COST
-                                self.selected_turret.upgrade()
-                                print(
-                                    f"Turret at ({self.selected_turret.x}, {self.selected_turret.y}) upgraded "
-                                    f"to level {self.selected_turret.turret_level}"
+                if selected_turret.turret_level < selected_turret.max_level:
+                    if self.upgrade_button.draw(screen, mapped_mouse_pos):
+                        if not selected_turret.tidal_active:
+                            if world.money >= c.UPGRADE_COST:
+                                world.money -= c.UPGRADE_COST
+                                selected_turret.upgrade()
+                                logger.debug(
+                                    "Turret at (%d, %d) upgraded to level %d",
+                                    selected_turret.x, selected_turret.y, selected_turret.turret_level,
                                 )
                                 self.placement_message = "Turret upgraded successfully!"
-                                self.message_timer = pygame.time.get_ticks()
+                                self.message_timer = now
                             else:
                                 self.placement_message = "Not enough money to upgrade turret!"
-                                self.message_timer = pygame.time.get_ticks()
-                                print("Not enough money to upgrade turret!")
+                                self.message_timer = now
+                                logger.debug("Not enough money to upgrade turret!")
                         else:
                             self.placement_message = "You can't upgrade turret, while it's tidally upgraded"
-                            self.message_timer = pygame.time.get_ticks()
-                            print("You can't upgrade turret, while it's tidally upgraded")
+                            self.message_timer = now
+                            logger.debug("You can't upgrade turret, while it's tidally upgraded")
 
-                if self.tidal_upgrade_button.draw(self.screen, mapped_mouse_pos):
+                if self.tidal_upgrade_button.draw(screen, mapped_mouse_pos):
                     if self.wave_started:
-                        if self.selected_turret:
+                        if selected_turret:
                             # Check if the turret is eligible for a tidal upgrade
-                            if not self.selected_turret.tidal_used and not self.selected_turret.tidal_active:
-                                if self.world.money >= c.TIDAL_UPGRADE_COST:
-                                    self.world.money -= c.TIDAL_UPGRADE_COST
-                                    self.selected_turret.tidally_upgrade()
-                                    print(
-                                        f"Turret at ({self.selected_turret.x}, {self.selected_turret.y}) "
-                                        f"has been tidally upgraded"
+                            if not selected_turret.tidal_used and not selected_turret.tidal_active:
+                                if world.money >= c.TIDAL_UPGRADE_COST:
+                                    world.money -= c.TIDAL_UPGRADE_COST
+                                    selected_turret.tidally_upgrade()
+                                    logger.debug(
+                                        "Turret at (%d, %d) has been tidally upgraded",
+                                        selected_turret.x, selected_turret.y,
                                     )
                                 else:
                                     self.placement_message = "Not enough money for tidal upgrade!"
-                                    self.message_timer = pygame.time.get_ticks()
-                                    print("Not enough money for tidal upgrade.")
+                                    self.message_timer = now
+                                    logger.debug("Not enough money for tidal upgrade.")
                             else:
-                                print("Turret cannot receive tidal upgrade again this round.")
+                                logger.debug("Turret cannot receive tidal upgrade again this round.")
                     else:
                         self.placement_message = "Start new round to tidally upgrade turret"
-                        self.message_timer = pygame.time.get_ticks()
-                        print("Start new round to tidally upgrade turret")
+                        self.message_timer = now
+                        logger.debug("Start new round to tidally upgrade turret")
 
                 # Draw SELL button
-                if self.sell_button.draw(self.screen, mapped_mouse_pos):
-                    turret_type = self.selected_turret.turret_type
+                if self.sell_button.draw(screen, mapped_mouse_pos):
+                    turret_type = selected_turret.turret_type
                     sell_price = (
                         self.turret_buy_costs.get(turret_type) * c.SELL_RETURN_RATE
                     )  # 30% of original cost of the turret
-                    self.world.money += int(sell_price)
-                    print(
-                        f"Sold turret at ({self.selected_turret.x}, {self.selected_turret.y}) for {int(sell_price)} $"
+                    world.money += int(sell_price)
+                    logger.debug(
+                        "Sold turret at (%d, %d) for %d $", selected_turret.x, selected_turret.y, int(sell_price)
                     )
 
                     # Remove turret from group
-                    self.turret_group.remove(self.selected_turret)
+                    self.turret_group.remove(selected_turret)
 
                     # Mark tile as unoccupied
                     turret_tile_num = (
-                        self.selected_turret.mouse_tile_y * self.COLS
-                    ) + self.selected_turret.mouse_tile_x
+                        selected_turret.mouse_tile_y * self.COLS
+                    ) + selected_turret.mouse_tile_x
 
-                    if turret_tile_num in self.occupied_tiles:
-                        del self.occupied_tiles[turret_tile_num]
+                    self.occupied_tiles[turret_tile_num] = None
 
                     # Reset selected turret
-                    self.selected_turret = None
+                    selected_turret = self.selected_turret = None
 
                     # Add placement message
                     self.placement_message = "Turret sold successfully!"
-                    self.message_timer = pygame.time.get_ticks()
+                    self.message_timer = now
 
             # Draw return to menu button
-            if self.back_to_menu_button.draw(self.screen, mapped_mouse_pos):
+            if self.back_to_menu_button.draw(screen, mapped_mouse_pos):
                 self.restart_level()
-                print("Back to Menu button clicked. Returning to Menu.")
+                world = self.world  # restart_level creates a new world
+                logger.debug("Back to Menu button clicked. Returning to Menu.")
 
             # Draw the skip button and its penalty text
-            if self.world.spawned_enemies == len(self.world.enemy_list) and len(self.enemy_group) > 0:
-                if self.skip_button.draw(self.screen, mapped_mouse_pos):
+            if not world.enemy_queue and len(self.enemy_group) > 0:  # every enemy of the wave was spawned
+                if self.skip_button.draw(screen, mapped_mouse_pos):
                     self.skip_wave()
                 # Calculate total penalty that would be applied if skip is used
-                total_penalty = sum(enemy.damage_inflicted for enemy in self.enemy_group)
+                total_penalty = self.enemy_group.total_damage  # kept up to date by the group
                 penalty_text = f"Skip Penalty: -{total_penalty} health"
                 # Draw the penalty text below the skip button.
                 self.draw_text(
                     penalty_text,
                     self.small_text_font,
                     "red",
-                    self.SCREEN_WIDTH + 30,
+                    screen_width + 30,
                     self.skip_button.rect.bottom + 10,
                 )
 
             # Display placement message if any exist
             if self.placement_message:
-                current_time = pygame.time.get_ticks()
+                current_time = now
                 if current_time - self.message_timer < 2000:  # Display message for 2 seconds
                     if "successfully" in self.placement_message:
                         color = "green"
@@ -1000,16 +1207,27 @@ class Game:
                         color = "red"
                     self.draw_text(
                         self.placement_message,
-                        self.text_font,
+                        text_font,
                         color,
-                        self.SCREEN_WIDTH + 20,
+                        screen_width + 20,
                         self.SCREEN_HEIGHT - 30,
                     )
                 else:
                     self.placement_message = ""  # Clear message after 2 seconds
 
     def draw(self):
-        """Draw the appropriate screen based on the current state."""
+        """
+        Draw the appropriate screen based on the current state.
+
+        Behavior:
+            - The menu and game over screens only change when the state or the difficulty changes, so once
+              such a screen was shown, scaling it to the window and updating the display is skipped.
+            - The screens are still drawn every frame, because their buttons are handled while drawing.
+        """
+        # Map the mouse position of this frame once, for all buttons drawn below
+        self.mapped_mouse_pos = self.map_mouse_cursor(frame.mouse_pos)
+
+        view = (self.state, self.current_difficulty_index)  # everything a static screen depends on
         if self.state == "menu":
             self.draw_menu()
         elif self.state == "game":
@@ -1017,11 +1235,13 @@ class Game:
         elif self.state == "game_over":
             self.draw_game_over()
 
-        # Scale self.screen to fit display_surface
-        scaled_screen = pygame.transform.scale(self.screen, self.display_surface.get_size())
-        self.display_surface.blit(scaled_screen, (0, 0))
+        if view[0] == "game" or view != self._presented_view:
+            # Scale self.screen straight into display_surface, without allocating a scaled copy and blitting it
+            pygame.transform.scale(self.screen, self.display_surface.get_size(), self.display_surface)
 
-        pygame.display.update()
+            pygame.display.update()
+            # if a button changed the state while drawing, the new screen has to be presented next frame
+            self._presented_view = view if self.state == view[0] else None
 
     def run(self):
         """
@@ -1029,15 +1249,48 @@ class Game:
 
         Behavior:
             - Handles events, updates game logic, and renders the screen.
+            - Game logic runs in fixed steps of SIM_STEP_MS: the elapsed time is accumulated and as many
+              updates are run as fit into it, so a slow frame doesn't slow the game down.
+            - SIM_STEP_MS is the whole ms delay Clock.tick waits for at FPS, so a frame that took the
+              usual time always gets exactly one update.
+            - At most MAX_SIM_STEPS updates run per frame, longer stalls (e.g. dragging the window) are dropped.
+            - The bound methods called every frame are looked up once before the loop.
         """
+        tick = self.clock.tick
+        fps = self.FPS
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        step = c.SIM_STEP_MS
+        max_lag = step * c.MAX_SIM_STEPS
+        lag = 0  # elapsed time not yet simulated, in ms
         run = True
         while run:
-            self.clock.tick(self.FPS)
-            run = self.handle_events()
-            self.update()
-            self.draw()
+            lag = min(lag + tick(fps), max_lag)
+            run = handle_events()
+            while lag >= step:
+                update()
+                lag -= step
+            draw()
         pygame.quit()
 
+    def update_mouse_scale(self):
+        """
+        Recalculate the scaling factors used by `map_mouse_cursor`.
+
+        Behavior:
+         - Determines the scaling factor for both x and y directions based on the ratio of
+          the internal game screen's dimensions to the display surface's dimensions.
+         - Has to be called whenever the display surface changes size (start up and window resize),
+          so mapping the mouse doesn't have to recompute the ratios on every call.
+        """
+        display_width, display_height = self.display_surface.get_size()  # Get current window size
+        screen_width, screen_height = self.screen.get_size()  # Get internal game screen size
+
+        # Calculate scaling factors for x and y axes
+        self._map_sx = screen_width / display_width
+        self._map_sy = screen_height / display_height
+
     def map_mouse_cursor(self, pos):
         """
         Map the mouse position from display_surface to internal screen coordinates.
@@ -1049,27 +1302,16 @@ class Game:
             tuple: The mapped mouse position on the internal screen.
 
         Behavior:
-         - Determines the scaling factor for both x and y directions based on the ratio of
-          the internal game screen's dimensions to the display surface's dimensions.
-         - Multiplies the raw mouse coordinates by the scaling factors to map them to
-          internal screen coordinates.
+         - Multiplies the raw mouse coordinates by the scaling factors cached by `update_mouse_scale`
+          to map them to internal screen coordinates.
 
         """
-        display_width, display_height = self.display_surface.get_size()  # Get current window size
-        screen_width, screen_height = self.screen.get_size()  # Get internal game screen size
-
-        # Calculate scaling factors for x and y axes
-        scale_x = screen_width / display_width
-        scale_y = screen_height / display_height
-
-        # Scale raw mouse position to internal screen coordinates
-        mapped_x = pos[0] * scale_x
-        mapped_y = pos[1] * scale_y
-
-        # print(f"Original mouse pos: {pos} -> Mapped mouse pos: ({mapped_x}, {mapped_y})")
-        return mapped_x, mapped_y
+        # print(f"Original mouse pos: {pos} -> Mapped mouse pos: ({pos[0] * self._map_sx}, {pos[1] * self._map_sy})")
+        return pos[0] * self._map_sx, pos[1] * self._map_sy
 
 
 if __name__ == "__main__":
+    # Debug messages are off by default, e.g. TOWER_DEFENSE_LOG_LEVEL=DEBUG turns them on
+    logging.basicConfig(level=os.environ.get(LOG_LEVEL_ENV, "WARNING").upper())
     game = Game()
     game.run()
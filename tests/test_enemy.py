@@ -0,0 +1,27 @@
+import pytest
+
+from enemy import ROTATION_STEP, angle_bucket
+
+
+@pytest.mark.parametrize(
+    "angle, expected",
+    [
+        (179.6, 180),  # just below the negative x-axis
+        (-179.6, 180),
+        (-89.9, 270),  # just past downwards
+        (89.98, 90),
+        (0.2, 0),
+        (-0.2, 0),  # wraps around to 0 instead of 355
+        (2.4, 0),
+        (2.6, 5),
+    ],
+)
+def test_angle_bucket_picks_nearest_bucket(angle, expected):
+    assert angle_bucket(angle) == expected
+
+
+def test_angle_bucket_stays_in_range():
+    for tenth in range(-1800, 1801):
+        bucket = angle_bucket(tenth / 10)
+        assert 0 <= bucket < 360
+        assert bucket % ROTATION_STEP == 0
@@ -1,10 +1,17 @@
 import math
+import logging
 import pygame
-from turret_data import TURRET_DATA
+from turret_data import TURRET_TYPE_ID, TURRET_STATS
 import const as c
+import frame
+
+logger = logging.getLogger(__name__)  # debug messages of the turrets, silent unless logging is configured
 
 # turret consts
 ANIMATION_DELAY = 15  # Time between two frames in ms
+ROTATION_BINS = 32  # Number of directions a turret image is rotated to, 11.25 degrees apart
+ROTATION_STEP = 360 / ROTATION_BINS
+ROTATION_CACHE_MAX_BYTES = 32 * 1024 * 1024  # Memory cap of the rotated images, least recently used dropped first
 
 
 class Turret(pygame.sprite.Sprite):
@@ -16,14 +23,20 @@ class Turret(pygame.sprite.Sprite):
 
     Attributes:
         turret_type (str): The type of turret (e.g., "purple", "blue").
+        type_id (int): Index of the turret type in `TURRET_STATS` from turret_data.py.
         turret_level (int): The current level of the turret (starts at 1).
+        max_level (int): The highest level the turret can be upgraded to (number of levels in TURRET_DATA).
         base_range (int): The base attack range of the turret.
         base_cooldown (int): The base cooldown time between attacks in ms.
         base_damage (int): The base damage dealt by the turret.
         range (int): The current attack range, which may differ due to upgrades.
+        range_sq (int): Square of `range`, compared against squared distances when targeting.
+        grid_cells (tuple): The spatial grid cells overlapped by `range`, the turret never moves so they are
+            only recomputed when the range changes.
         cooldown (int): The current cooldown time, affected by upgrades.
         damage (int): The current damage, affected by upgrades.
         last_shot (int): Timestamp of the last shot fired by the turret.
+        next_ready_time (int): Timestamp after which the turret may fire again (last_shot + cooldown).
         selected (bool): Indicates if the turret is selected by the player.
         target (Enemy): The current target enemy.
         animation_steps (int): Number of animation frames for the turret's firing sequence.
@@ -48,18 +61,28 @@ class Turret(pygame.sprite.Sprite):
         TIDAL_DURATION (int): Duration of the tidal upgrade in ms.
         range_hitbox (pygame.Surface): Visual representation of the turret’s range.
         range_rect (pygame.Rect): Bounding rectangle for the range hitbox.
+        _sheet_cache (dict): Class-level cache of animation lists keyed by (sprite sheet, steps).
+        _rotation_cache (dict): Class-level LRU cache of rotated images keyed by (animation frame, angle bin).
+        _rotation_cache_bytes (int): Pixel memory currently held by `_rotation_cache`.
+        _hitbox_cache (dict): Class-level cache of range hitbox surfaces keyed by (range, tidal_active).
 
     Methods:
+        set_range(new_range):
+            Sets the current range together with its square and the spatial grid cells it overlaps.
+
         create_range_hitbox():
             Creates or updates the visual representation of the turret’s range.
 
         load_images(sprite_sheet):
             Extracts animation frames from the given sprite sheet.
 
-        update(enemy_group):
+        get_rotated_image(frame_image, angle_bin):
+            Returns the animation frame rotated to the given direction, from the rotation cache.
+
+        update(enemy_hash):
             Updates the turret logic each frame, including animation, targeting, and tidal upgrades.
 
-        select_target(enemy_group):
+        select_target(enemy_hash):
             Searches for an enemy within the turret's range and attacks it.
 
         play_animation():
@@ -74,9 +97,28 @@ class Turret(pygame.sprite.Sprite):
         reset_tidal_upgrade():
             Resets the turret's stats after the tidal upgrade duration ends.
 
-        draw(surface):
-            Draws the turret and its range hitbox if selected.
+        update_image():
+            Picks the rotated image of the current animation frame closest to the turret's angle.
+
+        draw_range(surface):
+            Draws the turret's range hitbox.
     """
+    # Fixed attribute layout: values are stored in slots instead of the instance __dict__, which makes
+    # attribute access in the per-frame update and targeting code cheaper (pygame.sprite.Sprite keeps its own __dict__)
+    __slots__ = (
+        "turret_type", "type_id", "turret_level", "max_level", "base_range", "base_cooldown", "base_damage",
+        "range", "range_sq", "grid_cells", "cooldown", "damage", "last_shot", "next_ready_time", "selected", "target",
+        "animation_steps", "slow_amount", "slow_duration", "mouse_tile_x", "mouse_tile_y", "x", "y",
+        "sprite_sheets", "frame_index", "animation_list", "update_time", "angle",
+        "original_image", "image", "rect", "tidal_active", "tidal_used", "tidal_end_time",
+        "TIDAL_MULTIPLIER", "TIDAL_DURATION", "range_hitbox", "range_rect",
+    )
+
+    _sheet_cache = {}  # shared by all turrets, so each sprite sheet is cut only once
+    _rotation_cache = {}  # shared by all turrets, dict order doubles as the least recently used order
+    _rotation_cache_bytes = 0
+    _hitbox_cache = {}  # shared by all turrets, a hitbox only depends on the range and the tidal state
+
     def __init__(self, sprite_sheets, turret_type, mouse_tile_x, mouse_tile_y, x, y):
         """
          Initializes a turret with the specified type, position, and attributes.
@@ -90,7 +132,7 @@ class Turret(pygame.sprite.Sprite):
                    y (int): Y-coordinate of the turret’s center.
 
                Behavior:
-                   - Loads base stats, such as range, cooldown, and damage, from `TURRET_DATA`.
+                   - Loads base stats, such as range, cooldown, and damage, from `TURRET_STATS`.
                    - Initializes animation frames, targeting logic, and tidal upgrade parameters.
                    - Creates a visual representation of the turret’s attack range.
         """
@@ -98,50 +140,45 @@ class Turret(pygame.sprite.Sprite):
 
         # Turret type and level
         self.turret_type = turret_type
+        type_id = TURRET_TYPE_ID[self.turret_type]
+        self.type_id = type_id
         self.turret_level = 1  # Start at level 1
+        self.max_level = len(TURRET_STATS[type_id])  # checked every frame while the turret is selected
 
         # Base stats from turret data (serve as temp copy when returning to normal stats when tidally upgrade ends)
-        self.base_range = TURRET_DATA[self.turret_type][self.turret_level - 1].get("range")
-        self.base_cooldown = TURRET_DATA[self.turret_type][self.turret_level - 1].get("cooldown")
-        self.base_damage = TURRET_DATA[self.turret_type][self.turret_level - 1].get("damage")
+        # Slow effect parameters are only set for the purple turret, the other types have 0 in turret_data.py
+        (
+            self.base_range, self.base_cooldown, self.base_damage,
+            self.animation_steps, self.slow_amount, self.slow_duration,
+        ) = TURRET_STATS[type_id][self.turret_level - 1]
 
-        # Current stats (which may be modified by upgrades)
-        self.range = self.base_range
+        # Current stats (which may be modified by upgrades), the range is set once the position is known
         self.cooldown = self.base_cooldown
         self.damage = self.base_damage
 
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = frame.now
+        self.next_ready_time = self.last_shot + self.cooldown
         self.selected = False
         self.target = None
 
-        self.animation_steps = TURRET_DATA[self.turret_type][self.turret_level - 1].get("animation_steps")
-
-        # Slow effect parameters (only for purple turret)
-        if self.turret_type == "purple":
-            self.slow_amount = TURRET_DATA[self.turret_type][self.turret_level - 1].get("slow_amount", 0)
-            self.slow_duration = TURRET_DATA[self.turret_type][self.turret_level - 1].get("slow_duration", 0)
-        else:
-            self.slow_amount = 0
-            self.slow_duration = 0
-
         # Position variables
         self.mouse_tile_x = mouse_tile_x
         self.mouse_tile_y = mouse_tile_y
         self.x = x
         self.y = y
+        self.set_range(self.base_range)
 
         # Animation variables
         self.sprite_sheets = sprite_sheets
         self.frame_index = 0
         self.animation_list = self.load_images(self.sprite_sheets[self.turret_level - 1])
-        self.update_time = pygame.time.get_ticks()
+        self.update_time = frame.now
 
         # Initial image update
         self.angle = 90
         self.original_image = self.animation_list[self.frame_index]
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
+        self.image = None  # set by update_image, together with rect
+        self.update_image()
 
         # Tidal Upgrade Variables
         self.tidal_active = False  # Indicates if a tidal upgrade is currently in effect
@@ -153,6 +190,30 @@ class Turret(pygame.sprite.Sprite):
         # Create the range hitbox
         self.create_range_hitbox()
 
+    def set_range(self, new_range):
+        """
+        Sets the turret's current range.
+
+        Args:
+            new_range (int): The new attack range in pixels.
+
+        Behavior:
+            - Stores the squared range, targeting compares squared distances so no sqrt is needed.
+            - Precomputes the spatial grid cells overlapped by the range, in the order select_target scans them.
+        """
+        self.range = new_range
+        self.range_sq = new_range * new_range
+        shift = c.ENEMY_HASH_CELL_SHIFT
+        min_cell_x = int(self.x - new_range) >> shift
+        max_cell_x = int(self.x + new_range) >> shift
+        min_cell_y = int(self.y - new_range) >> shift
+        max_cell_y = int(self.y + new_range) >> shift
+        self.grid_cells = tuple(
+            (cell_x, cell_y)
+            for cell_x in range(min_cell_x, max_cell_x + 1)
+            for cell_y in range(min_cell_y, max_cell_y + 1)
+        )
+
     def create_range_hitbox(self):
         """
         Creates or updates the visual representation of the turret’s range.
@@ -160,14 +221,22 @@ class Turret(pygame.sprite.Sprite):
             Behavior:
                 - Draws a circle representing the turret’s range.
                 - Displays a pink circle when a tidal upgrade is active and a gray circle otherwise.
+                - Each (range, tidal state) circle is drawn once and the surface is shared by all turrets,
+                  it is never drawn on, so sharing it is safe.
         """
-        self.range_hitbox = pygame.Surface((self.range * 2, self.range * 2), pygame.SRCALPHA)
-        self.range_hitbox.fill((0, 0, 0, 0))
-        if not self.tidal_active:  # pink range when turret is tidally upgraded
-            pygame.draw.circle(self.range_hitbox, (128, 128, 128, 100), (self.range, self.range), self.range)
-        else:
-            pygame.draw.circle(self.range_hitbox, (255, 0, 255, 100), (self.range, self.range), self.range)
-        self.range_hitbox.set_alpha(100)
+        key = (self.range, self.tidal_active)
+        range_hitbox = self._hitbox_cache.get(key)
+        if range_hitbox is None:
+            range_hitbox = pygame.Surface((self.range * 2, self.range * 2), pygame.SRCALPHA)
+            range_hitbox.fill((0, 0, 0, 0))
+            if not self.tidal_active:  # pink range when turret is tidally upgraded
+                pygame.draw.circle(range_hitbox, (128, 128, 128, 100), (self.range, self.range), self.range)
+            else:
+                pygame.draw.circle(range_hitbox, (255, 0, 255, 100), (self.range, self.range), self.range)
+            range_hitbox = range_hitbox.convert_alpha()  # display pixel format, converted before set_alpha
+            range_hitbox.set_alpha(100)
+            self._hitbox_cache[key] = range_hitbox
+        self.range_hitbox = range_hitbox
         self.range_rect = self.range_hitbox.get_rect()
         self.range_rect.center = self.rect.center
 
@@ -180,63 +249,130 @@ class Turret(pygame.sprite.Sprite):
 
         Returns:
             list: A list of Pygame surfaces, each representing an animation frame.
+
+        Behavior:
+            - The result is cached per sprite sheet, so every turret (and upgrade) of that level shares the
+              same frame surfaces, which keeps the rotation cache keys shared as well.
         """
+        key = (sprite_sheet, self.animation_steps)
+        animation_list = self._sheet_cache.get(key)
+        if animation_list is not None:
+            return animation_list
+
         size = sprite_sheet.get_height()
         animation_list = []
         for i in range(self.animation_steps):
-            frame = sprite_sheet.subsurface(i * size, 0, size, size)
-            animation_list.append(frame)
+            frame_image = sprite_sheet.subsurface(i * size, 0, size, size)  # `frame` is the module
+            animation_list.append(frame_image)
+        self._sheet_cache[key] = animation_list
         return animation_list
 
-    def update(self, enemy_group):
+    @classmethod
+    def get_rotated_image(cls, frame_image, angle_bin):
+        """
+        Returns an animation frame rotated to one of the `ROTATION_BINS` directions.
+
+        Args:
+            frame_image (pygame.Surface): Animation frame from `load_images`.
+            angle_bin (int): Index of the direction, `angle_bin * ROTATION_STEP` degrees.
+
+        Returns:
+            pygame.Surface: The rotated frame.
+
+        Behavior:
+            - Rotations are computed lazily, the first time a (frame, direction) is needed, so placing or
+              upgrading a turret never rotates a whole sprite sheet at once.
+            - Rotated images are kept in a least recently used cache holding at most `ROTATION_CACHE_MAX_BYTES`
+              of pixels, an image still shown by a turret stays alive through the turret's `image`.
+        """
+        cache = cls._rotation_cache
+        key = (frame_image, angle_bin)  # the surface itself is the key, so an entry can't go stale
+        image = cache.pop(key, None)
+        if image is None:
+            # rotozoom returns its own surface format, converting it to the display format keeps the blits cheap
+            image = pygame.transform.rotozoom(frame_image, angle_bin * ROTATION_STEP, 1).convert_alpha()
+            cls._rotation_cache_bytes += image.get_pitch() * image.get_height()
+            while cache and cls._rotation_cache_bytes > ROTATION_CACHE_MAX_BYTES:
+                oldest = cache.pop(next(iter(cache)))  # dicts keep insertion order, so this is the oldest entry
+                cls._rotation_cache_bytes -= oldest.get_pitch() * oldest.get_height()
+        cache[key] = image  # (re)inserted last, as the most recently used entry
+        return image
+
+    def update(self, enemy_hash):
         """
         Updates the turret logic every frame.
 
         Args:
-            enemy_group (pygame.sprite.Group): Group of enemy sprites currently on the map.
+            enemy_hash (dict): Spatial grid of the enemies on the map, `World.enemy_grid`.
 
         Behavior:
             - Checks if a tidal upgrade is active and resets it if expired.
             - Plays the turret's animation if it has a target.
             - Selects a new target if the turret is not currently targeting an enemy.
+            - Returns right away while an idle turret is still cooling down, which is most frames.
         """
+        now = frame.now
+        if self.target is None and not self.tidal_active and now <= self.next_ready_time:
+            return  # nothing to animate, expire or shoot yet
+
         # Check if tidal upgrade is active and check if it has expired.
-        if self.tidal_active and pygame.time.get_ticks() >= self.tidal_end_time:
+        if self.tidal_active and now >= self.tidal_end_time:
             self.reset_tidal_upgrade()
 
         if self.target:
             self.play_animation()
         else:
-            if pygame.time.get_ticks() - self.last_shot > self.cooldown:
-                self.select_target(enemy_group)
+            if now > self.next_ready_time:  # same as now - last_shot > cooldown
+                self.select_target(enemy_hash)
 
-    def select_target(self, enemy_group):
+    def select_target(self, enemy_hash):
         """
           Searches for an enemy within the turret's range and then attacks it.
 
           Args:
-              enemy_group (pygame.sprite.Group): Group of enemy sprites currently on the map.
+              enemy_hash (dict): Spatial hash mapping a cell (x >> ENEMY_HASH_CELL_SHIFT, y >> ENEMY_HASH_CELL_SHIFT)
+                  to a list of (order, enemy) tuples, where order is the enemy's position in the enemy group.
 
           Behavior:
-              - Iterates through all enemies in the group.
-              - If an enemy is within range, it becomes the turret's target.
+              - Only checks enemies in the precomputed `grid_cells` of the range, comparing squared distances
+                (`range_sq`) so no square root is taken per enemy.
+              - Enemies outside the bounding box of the range are rejected before the distance is computed.
+              - The first enemy of the group (lowest order) within range becomes the turret's target,
+                the same enemy a scan over the whole group would pick.
               - The turret inflicts damage and applies slow effects if applicable.
         """
-
-        for enemy in enemy_group:
-            if enemy.health > 0:
-                x_dist = enemy.pos[0] - self.x
-                y_dist = enemy.pos[1] - self.y
-                dist = math.sqrt(x_dist**2 + y_dist**2)
-                if dist < self.range:
-                    self.target = enemy
-                    self.angle = math.degrees(math.atan2(-y_dist, x_dist))
-                    # Inflict damage on enemy
-                    enemy.health -= self.damage
-                    # Apply slow effect if appropriate
-                    if self.turret_type == "purple" and self.slow_amount > 0 and self.slow_duration > 0:
-                        enemy.apply_slow(self.slow_amount, self.slow_duration)
-                    break
+        turret_range = self.range
+        range_sq = self.range_sq
+        target = None
+        target_order = 0
+        for cell in self.grid_cells:
+            bucket = enemy_hash.get(cell)
+            if bucket is None:
+                continue
+            for order, enemy in bucket:
+                if target is not None and order > target_order:
+                    break  # buckets are in group order, the rest of this cell comes after the current target
+                if enemy.health > 0:
+                    x_dist = enemy.x - self.x
+                    if x_dist > turret_range or x_dist < -turret_range:
+                        continue  # outside the bounding box of the range, the scanned cells reach past it
+                    y_dist = enemy.y - self.y
+                    if y_dist > turret_range or y_dist < -turret_range:
+                        continue
+                    if x_dist * x_dist + y_dist * y_dist < range_sq:  # same as dist < range, without the sqrt
+                        target = enemy
+                        target_order = order
+                        break
+
+        if target is not None:
+            self.target = target
+            self.angle = math.degrees(math.atan2(-(target.y - self.y), target.x - self.x))
+            self.update_image()  # turn towards the new target
+            # Inflict damage on enemy
+            target.health -= self.damage
+            # Apply slow effect if appropriate
+            if self.turret_type == "purple" and self.slow_amount > 0 and self.slow_duration > 0:
+                target.apply_slow(self.slow_amount, self.slow_duration)
 
     def play_animation(self):
         """
@@ -246,14 +382,18 @@ class Turret(pygame.sprite.Sprite):
             - Cycles through animation frames while the turret is firing.
             - Resets the animation and target when firing is complete.
         """
-        self.original_image = self.animation_list[self.frame_index]
-        if pygame.time.get_ticks() - self.update_time > ANIMATION_DELAY:
-            self.update_time = pygame.time.get_ticks()
+        image = self.animation_list[self.frame_index]
+        if image is not self.original_image:  # only a new animation frame has to be rotated again
+            self.original_image = image
+            self.update_image()
+        if frame.now - self.update_time > ANIMATION_DELAY:
+            self.update_time = frame.now
             if self.frame_index < len(self.animation_list) - 1:
                 self.frame_index += 1
             else:
                 self.frame_index = 0
-                self.last_shot = pygame.time.get_ticks()
+                self.last_shot = frame.now
+                self.next_ready_time = self.last_shot + self.cooldown
                 self.target = None
 
     def upgrade(self):
@@ -261,32 +401,26 @@ class Turret(pygame.sprite.Sprite):
         Permanently upgrades the turret's level and stats.
 
         Behavior:
-            - Increases the turret's level and updates range, cooldown, damage based on `TURRET_DATA`.
+            - Increases the turret's level and updates range, cooldown, damage based on `TURRET_STATS`.
             - Reloads animation frames and updates the range hitbox.
         """
-        if self.turret_level < len(TURRET_DATA[self.turret_type]):
+        if self.turret_level < self.max_level:
             self.turret_level += 1
-            self.base_range = TURRET_DATA[self.turret_type][self.turret_level - 1].get("range")
-            self.base_cooldown = TURRET_DATA[self.turret_type][self.turret_level - 1].get("cooldown")
-            self.base_damage = TURRET_DATA[self.turret_type][self.turret_level - 1].get("damage")
+            (
+                self.base_range, self.base_cooldown, self.base_damage,
+                self.animation_steps, self.slow_amount, self.slow_duration,
+            ) = TURRET_STATS[self.type_id][self.turret_level - 1]
             # Reset current stats to new base values
-            self.range = self.base_range
+            self.set_range(self.base_range)
             self.cooldown = self.base_cooldown
+            self.next_ready_time = self.last_shot + self.cooldown
             self.damage = self.base_damage
 
-            if self.turret_type == "purple":
-                self.slow_amount = TURRET_DATA[self.turret_type][self.turret_level - 1].get("slow_amount", 0)
-                self.slow_duration = TURRET_DATA[self.turret_type][self.turret_level - 1].get(
-                    "slow_duration", 0
-                )
-            else:
-                self.slow_amount = 0
-                self.slow_duration = 0
-
             self.animation_list = self.load_images(self.sprite_sheets[self.turret_level - 1])
             self.original_image = self.animation_list[self.frame_index]
+            self.update_image()
             self.create_range_hitbox()
-            print("Turret upgraded permanently.")
+            logger.debug("Turret upgraded permanently.")
 
     def tidally_upgrade(self):
         """
@@ -299,14 +433,14 @@ class Turret(pygame.sprite.Sprite):
         """
         if not self.tidal_used and not self.tidal_active:
             # Apply the multiplier only once
-            self.range = int(self.base_range * self.TIDAL_MULTIPLIER)
+            self.set_range(int(self.base_range * self.TIDAL_MULTIPLIER))
             self.damage = int(self.base_damage * self.TIDAL_MULTIPLIER)
 
             self.tidal_active = True
             self.tidal_used = True
-            self.tidal_end_time = pygame.time.get_ticks() + self.TIDAL_DURATION
+            self.tidal_end_time = frame.now + self.TIDAL_DURATION
             self.create_range_hitbox()
-            print(f"Tidal upgrade applied  turret at ({self.x}, {self.y}) until {self.tidal_end_time}ms.")
+            logger.debug("Tidal upgrade applied  turret at (%d, %d) until %dms.", self.x, self.y, self.tidal_end_time)
 
     def reset_tidal_upgrade(self):
         """
@@ -316,30 +450,43 @@ class Turret(pygame.sprite.Sprite):
             - Restores range, damage, and cooldown to base values.
             - Updates the range hitbox to reflect the normal range.
         """
-        self.range = self.base_range
+        self.set_range(self.base_range)
         self.damage = self.base_damage
         self.cooldown = self.base_cooldown
+        self.next_ready_time = self.last_shot + self.cooldown
         self.tidal_active = False
         self.tidal_end_time = 0
         self.create_range_hitbox()
-        print(f"Tidal upgrade expired for turret at ({self.x}, {self.y}).")
+        logger.debug("Tidal upgrade expired for turret at (%d, %d).", self.x, self.y)
 
-    def draw(self, surface):
+    def update_image(self):
         """
-        Draws the turret and its range hitbox if selected.
-
-        Args:
-            surface (pygame.Surface): The surface to draw the turret and hitbox on.
+        Picks the rotated image of the current animation frame closest to the turret's angle.
 
         Behavior:
-            - Rotates and draws the turret image on the screen.
-            - Draws a translucent circle representing the turret's range if selected.
+            - Called only when the animation frame or the angle changes, so drawing the turret
+              is a plain blit of `image` at `rect`.
+            - The angle is rounded to one of `ROTATION_BINS` directions, whose images come from
+              the shared rotation cache of `get_rotated_image`.
+            - The turret never moves, so its rect is only rebuilt when the size of the image changes.
         """
         # turret images default orientation points upward so we subtract 90
         # because the rotation angle is measured from the positive x-axis.
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle - 90, 1)
-        self.rect = self.image.get_rect()
-        self.rect.center = (self.x, self.y)
-        surface.blit(self.image, self.rect)
-        if self.selected:
-            surface.blit(self.range_hitbox, self.range_rect)
+        angle_bin = round((self.angle - 90) % 360 / ROTATION_STEP) % ROTATION_BINS
+        image = self.get_rotated_image(self.original_image, angle_bin)
+        if self.image is None or image.get_size() != self.image.get_size():
+            self.rect = image.get_rect()
+            self.rect.center = (self.x, self.y)
+        self.image = image
+
+    def draw_range(self, surface):
+        """
+        Draws the turret's range hitbox.
+
+        Args:
+            surface (pygame.Surface): The surface to draw the hitbox on.
+
+        Behavior:
+            - Draws a translucent circle representing the turret's range, used for the selected turret.
+        """
+        surface.blit(self.range_hitbox, self.range_rect)
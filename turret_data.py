@@ -98,3 +98,23 @@ TURRET_DATA = {
         }
     ]
 }
+
+
+# TURRET_DATA flattened into one record per level, indexed by [turret type id][level - 1], so a turret reads all its
+# stats with a single tuple unpack instead of a dict lookup, a list index and a .get() with a string key for every stat.
+# Record layout: (range, cooldown, damage, animation_steps, slow_amount, slow_duration)
+TURRET_TYPE_ID = {turret_type: type_id for type_id, turret_type in enumerate(TURRET_DATA)}
+TURRET_STATS = tuple(
+    tuple(
+        (
+            level["range"],
+            level["cooldown"],
+            level["damage"],
+            level["animation_steps"],
+            level.get("slow_amount", 0),  # only the purple turret slows enemies, the other types get 0
+            level.get("slow_duration", 0),
+        )
+        for level in levels
+    )
+    for levels in TURRET_DATA.values()
+)
@@ -1,8 +1,69 @@
+import math
+from array import array
+from collections import deque
 import pygame
 import random
-from enemy_data import WAVE_ENEMY_DATA
+from enemy_data import WAVE_ENEMY_LIST
 import const as c
 
+SAND_TILE_ID = 161  # tile id of sand, the only tile turrets can be placed on
+
+
+def simplify_waypoints(waypoints):
+    """
+    Removes waypoints that lie in the middle of a straight line between their neighbours.
+
+    A waypoint B between A and C is dropped when the cross product (B - A) x (C - B) is zero and the
+    path keeps going forward through it, so enemies don't stop at waypoints where their direction
+    doesn't change. Waypoints where the path turns back are kept.
+
+    Args:
+        waypoints (list): List of [x, y] waypoint coordinates.
+
+    Returns:
+        list: The waypoints without the redundant collinear ones.
+    """
+    if len(waypoints) < 3:
+        return list(waypoints)
+    simplified = [waypoints[0]]
+    for i in range(1, len(waypoints) - 1):
+        ax, ay = simplified[-1]
+        bx, by = waypoints[i]
+        cx, cy = waypoints[i + 1]
+        cross = (bx - ax) * (cy - by) - (by - ay) * (cx - bx)
+        dot = (bx - ax) * (cx - bx) + (by - ay) * (cy - by)
+        if cross != 0 or dot <= 0:
+            simplified.append(waypoints[i])
+    simplified.append(waypoints[-1])
+    return simplified
+
+
+def precompute_path(waypoints):
+    """
+    Precomputes the direction, length and facing angle of every path segment between two consecutive waypoints.
+
+    The segments never change during a level, so enemies can follow them without normalizing
+    a movement vector (sqrt + divide) or calling atan2 every frame.
+
+    Args:
+        waypoints (list): List of [x, y] waypoint coordinates.
+
+    Returns:
+        list: List of (unit_dx, unit_dy, segment_length, angle) tuples, one per path segment.
+              The angle is in degrees, as expected by pygame.transform.rotate.
+    """
+    path = []
+    for (start_x, start_y), (end_x, end_y) in zip(waypoints, waypoints[1:]):
+        dx = end_x - start_x
+        dy = end_y - start_y
+        segment_length = math.hypot(dx, dy)
+        if segment_length == 0:  # duplicated waypoint, there is no direction to follow
+            continue
+        # we invert y-coord because in pygame, the y-coord increases downwards, in contrary to Cartesian system
+        angle = math.degrees(math.atan2(-dy, dx))
+        path.append((dx / segment_length, dy / segment_length, segment_length, angle))
+    return path
+
 
 class World:
     """
@@ -12,13 +73,18 @@ class World:
            level (int): Current level of the game.
            health (int): Player's health points.
            money (int): Player's money.
-           tile_map (list): List of tile data for the map background.
+           tile_map (array): Compact array ('i') of tile ids for the map background.
+           sand_mask (bytes): One byte per tile, 1 where a turret can be placed (sand) and 0 elsewhere.
            waypoints (list): List of waypoints (coordinates) for enemy paths.
+           path (list): Precomputed (unit_dx, unit_dy, segment_length, angle) tuples for each path segment.
            level_data (dict): Data for the current level, typically loaded from a Tiled .tmj file.
            image (pygame.Surface): Image of the map background.
            enemy_list (list): List of enemies to spawn for the current wave.
+           enemy_queue (deque): Enemies of the current wave that were not spawned yet, in spawn order.
+           total_enemies_this_wave (int): Number of enemies in the current wave (length of enemy_list).
            spawned_enemies (int): Number of enemies that have been spawned.
            killed_enemies (int): Number of enemies that have been killed.
+           enemy_grid (dict): Spatial hash of the enemies, maps a cell to a list of (order, enemy) tuples.
            missed_enemies (int): Number of enemies that reached the end without being killed.
 
        Methods:
@@ -34,6 +100,9 @@ class World:
            process_enemies():
                Populates the enemy list with enemies to spawn in the current wave.
 
+           build_enemy_grid(enemy_group):
+               Buckets the enemies into `enemy_grid` for the turret range queries.
+
            draw(surface):
                Draws the map image onto the given surface.
 
@@ -55,14 +124,19 @@ class World:
         self.level = 1
         self.health = c.HEALTH
         self.money = c.MONEY
-        self.tile_map = []
+        self.tile_map = array("i")
+        self.sand_mask = b""
         self.waypoints = []
+        self.path = []
         self.level_data = world_data
         self.image = map_image
         self.enemy_list = []
+        self.enemy_queue = deque()
+        self.total_enemies_this_wave = 0
         self.spawned_enemies = 0
         self.killed_enemies = 0
         self.missed_enemies = 0
+        self.enemy_grid = {}  # rebuilt every frame by build_enemy_grid (reused, only cleared)
 
     def process_data(self):
         """
@@ -70,15 +144,19 @@ class World:
 
         For the tile map:
         - Extracts data from the "Background" layer.
+        - Builds the sand mask used to check turret placement.
 
         For the waypoints:
         - Parses the "waypoints" layer, extracting a list of waypoints for enemy movement.
+        - Drops collinear waypoints that don't change the direction of the path.
+        - Precomputes the path segments shared by all enemies on this map.
         """
         for layer in self.level_data[
             "layers"
         ]:  # getting into layers list from level.tmj (while using Tiled, tilemap have to be created as .csv format)
             if layer["name"] == "Background":  # processing all tiles
-                self.tile_map = layer["data"]
+                self.tile_map = array("i", layer["data"])  # packed ints instead of a list of int objects
+                self.sand_mask = bytes(1 if tile == SAND_TILE_ID else 0 for tile in self.tile_map)
                 # print("\n ",self.tile_map) # return one long list e.g. [7, 7, 7, 7, 8, 6, 7, 7, 12, 12, 12, 12, .... ]
             elif layer["name"] == "waypoints":  # processing waypoints
                 for obj in layer["objects"]:
@@ -87,6 +165,8 @@ class World:
                         "\n ", waypoint_data
                     )  # so printed data is list that have bunch of dictionaries inside it so we need to parse it more
                     self.process_waypoints(waypoint_data)
+        self.waypoints = simplify_waypoints(self.waypoints)
+        self.path = precompute_path(self.waypoints)
 
     def process_waypoints(self, data):
         """
@@ -107,17 +187,37 @@ class World:
         """
          Populates the enemy list for the current wave based on the `WAVE_ENEMY_DATA`.
 
-         Function appends each enemy type to the `self.enemy_list` based on the spawn count from configuration file
-         Then it randomizes the `self.enemy_list` to shuffle the order of enemy spawning.
+         Function copies the enemy types of the wave, expanded once at import time into `WAVE_ENEMY_LIST`,
+         into `self.enemy_list`. Then it randomizes the `self.enemy_list` to shuffle the order of enemy spawning.
+         The shuffled list is queued in `self.enemy_queue`, which the game pops from when spawning.
          """
-        enemies = WAVE_ENEMY_DATA[self.level - 1]
-        for enemy_type in enemies:
-            enemies_to_spawn = enemies[enemy_type]
-            for enemy in range(enemies_to_spawn):
-                # print(enemy_type)
-                self.enemy_list.append(enemy_type)
-            # now randomize the list to shuffle the enemies
-            random.shuffle(self.enemy_list)
+        self.enemy_list.extend(WAVE_ENEMY_LIST[self.level - 1])
+        # now randomize the list to shuffle the enemies, once the whole wave is in it
+        random.shuffle(self.enemy_list)
+        self.enemy_queue.extend(self.enemy_list)
+        self.total_enemies_this_wave = len(self.enemy_list)
+
+    def build_enemy_grid(self, enemy_group):
+        """
+         Buckets the enemies into `enemy_grid`, a uniform grid of square cells of 2**ENEMY_HASH_CELL_SHIFT pixels.
+
+         Args:
+         enemy_group (EnemyGroup): The enemies on the map, after they moved this frame.
+
+         Each cell (x >> ENEMY_HASH_CELL_SHIFT, y >> ENEMY_HASH_CELL_SHIFT) maps to a list of (order, enemy) tuples,
+         where order is the enemy's position in the group, so turrets can still pick the first enemy in range,
+         exactly as when scanning the whole group.
+        """
+        enemy_grid = self.enemy_grid
+        enemy_grid.clear()
+        shift = c.ENEMY_HASH_CELL_SHIFT
+        for order, enemy in enumerate(enemy_group):
+            cell = (int(enemy.x) >> shift, int(enemy.y) >> shift)
+            bucket = enemy_grid.get(cell)
+            if bucket is None:
+                enemy_grid[cell] = [(order, enemy)]
+            else:
+                bucket.append((order, enemy))
 
     def draw(self, surface):
         """
@@ -135,13 +235,15 @@ class World:
          Returns:
          bool: True if the wave is completed, False otherwise.
         """
-        return (self.killed_enemies + self.missed_enemies) == len(self.enemy_list)
+        return (self.killed_enemies + self.missed_enemies) == self.total_enemies_this_wave
 
     def reset_values(self):
         """
          Resets values to prepare for a new wave.
         """
         self.enemy_list = []
+        self.enemy_queue.clear()
+        self.total_enemies_this_wave = 0
         self.level += 1
         self.spawned_enemies = 0
         self.killed_enemies = 0